@@ -55,6 +55,8 @@ class UIMetadataService:
         return {
             "must_audit": audit.must_audit,
             "min_log_level": audit.min_log_level,
-            "critical_actions": audit.critical_actions,
+            "critical_actions": (
+                list(audit.critical_actions) if audit.critical_actions is not None else None
+            ),
             "retention_days": audit.retention_days,
         }
@@ -17,6 +17,7 @@ Version: 1.1.0
 """
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, Dict, Any
 
 
@@ -159,13 +160,16 @@ class CreateAuditLogDTO:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class AuditLogFilterDTO:
     """
     Filter-Kriterien für Log-Abfragen.
 
     Alle Felder optional → Flexibles Filtern.
     Kombinierbar mit AND-Logik.
+
+    Immutable (frozen=True) → WHERE-Klausel wird pro Instanz nur einmal
+    gebaut (siehe sql_conditions).
     """
     user_id: Optional[int] = None
     feature: Optional[str] = None
@@ -177,6 +181,17 @@ class AuditLogFilterDTO:
     limit: int = 100
     offset: int = 0
 
+    @cached_property
+    def sql_conditions(self) -> tuple[str, tuple]:
+        """
+        SQL WHERE-Klausel, einmalig pro Instanz berechnet.
+
+        Returns:
+            Tuple (WHERE-String, Parameter-Tuple)
+        """
+        where_clause, params = self._build_sql_conditions()
+        return where_clause, tuple(params)
+
     def to_sql_conditions(self) -> tuple[str, list]:
         """
         Konvertiert Filter zu SQL WHERE-Klausel.
@@ -190,6 +205,11 @@ class AuditLogFilterDTO:
             >>> print(where)  # "user_id = ?  AND feature = ?"
             >>> print(params)  # [42, "auth"]
         """
+        where_clause, params = self.sql_conditions
+        return where_clause, list(params)
+
+    def _build_sql_conditions(self) -> tuple[str, list]:
+        """Baut WHERE-Klausel und Parameter aus den gesetzten Filtern."""
         conditions = []
         params = []
 
@@ -24,6 +24,15 @@ class AuditRepository:
     Tabellen-Schema wird automatisch erstellt, falls nicht vorhanden.
     """
 
+    _INSERT_QUERY = """
+        INSERT INTO audit_logs (
+            timestamp, user_id, username, feature, action,
+            log_level, severity, ip_address, session_id,
+            module, function, details
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: str):
         """
         Initialisiert Repository.
@@ -98,41 +107,69 @@ class AuditRepository:
 
         # Timestamp hier generieren
         timestamp = datetime.now().isoformat()
+        params = self._to_insert_params(log_dto, timestamp)
 
-        query = """
-            INSERT INTO audit_logs (
-                timestamp, user_id, username, feature, action,
-                log_level, severity, ip_address, session_id,
-                module, function, details
+        try:
+            cursor = self._conn.execute(self._INSERT_QUERY, params)
+            self._conn.commit()
+            return cursor.lastrowid
+        except sqlite3.Error as e:
+            raise DatabaseException(
+                f"Fehler beim Erstellen des Logs: {str(e)}",
+                original_exception=e
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+
+    def create_many(self, log_dtos: List[CreateAuditLogDTO]) -> int:
+        """
+        Erstellt mehrere Audit-Log-Einträge in einer Transaktion.
+
+        Alle DTOs werden vorab validiert; bei einem ungültigen DTO wird
+        nichts geschrieben. Alle Einträge erhalten denselben Timestamp.
+
+        Args:
+            log_dtos: Liste von CreateAuditLogDTOs
+
+        Returns:
+            Anzahl erstellter Logs
+
+        Raises:
+            ValueError: Bei ungültigem DTO
+            DatabaseException: Bei DB-Fehlern
         """
+        for log_dto in log_dtos:
+            log_dto.validate()
 
-        params = (
+        timestamp = datetime.now().isoformat()
+        rows = [self._to_insert_params(dto, timestamp) for dto in log_dtos]
+
+        try:
+            with self._conn:
+                cursor = self._conn.executemany(self._INSERT_QUERY, rows)
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            raise DatabaseException(
+                f"Fehler beim Erstellen von {len(rows)} Logs: {str(e)}",
+                original_exception=e
+            )
+
+    @staticmethod
+    def _to_insert_params(log_dto: CreateAuditLogDTO, timestamp: str) -> tuple:
+        """Konvertiert CreateAuditLogDTO zu INSERT-Parametern."""
+        return (
             timestamp,
             log_dto.user_id,
-            log_dto. username or f"user_{log_dto.user_id}",
+            log_dto.username or f"user_{log_dto.user_id}",
             log_dto.feature,
             log_dto.action,
             log_dto.log_level,
             log_dto.severity,
             log_dto.ip_address,
             log_dto.session_id,
-            log_dto. module,
-            log_dto. function,
+            log_dto.module,
+            log_dto.function,
             json.dumps(log_dto.details) if log_dto.details else None,
         )
 
-        try:
-            cursor = self._conn.execute(query, params)
-            self._conn.commit()
-            return cursor.lastrowid
-        except sqlite3.Error as e:
-            raise DatabaseException(
-                f"Fehler beim Erstellen des Logs: {str(e)}",
-                original_exception=e
-            )
-
     def find_by_id(self, log_id: int) -> Optional[AuditLogDTO]:
         """
         Findet Log nach ID.
@@ -171,13 +208,13 @@ class AuditRepository:
         Raises:
             DatabaseException: Bei DB-Fehlern
         """
-        where_clause, params = filters.to_sql_conditions()
+        where_clause, params = filters.sql_conditions
 
         query = f"""
             SELECT *
             FROM audit_logs
             WHERE {where_clause}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             LIMIT ?  OFFSET ?
         """
 
@@ -201,6 +238,11 @@ class AuditRepository:
         """
         Volltext-Suche in details und action.
 
+        Die details-Spalte wird über SQLite JSON1 (json_tree) durchsucht:
+        verglichen werden nur Objekt-Keys und Blatt-Werte, nicht der
+        serialisierte JSON-String. Array-Indizes (integer-Keys) zählen nicht
+        als Treffer. Ungültiges JSON in details wird übersprungen.
+
         Args:
             keyword: Suchbegriff
             filters: optionale zusätzliche Filter
@@ -214,20 +256,32 @@ class AuditRepository:
         if filters is None:
             filters = AuditLogFilterDTO()
 
-        where_clause, params = filters.to_sql_conditions()
+        where_clause, params = filters.sql_conditions
 
         query = f"""
             SELECT *
             FROM audit_logs
             WHERE {where_clause}
-              AND (details LIKE ? OR action LIKE ?)
-            ORDER BY timestamp DESC
+              AND (
+                    action LIKE ?
+                    OR (
+                        details IS NOT NULL
+                        AND json_valid(details)
+                        AND EXISTS (
+                            SELECT 1
+                            FROM json_tree(audit_logs.details) AS node
+                            WHERE node.atom LIKE ?
+                               OR (typeof(node.key) = 'text' AND node.key LIKE ?)
+                        )
+                    )
+              )
+            ORDER BY timestamp DESC, id DESC
             LIMIT ? OFFSET ? 
         """
 
         params = list(params)
         pattern = f"%{keyword}%"
-        params.extend([pattern, pattern, filters.limit, filters.offset])
+        params.extend([pattern, pattern, pattern, filters.limit, filters.offset])
 
         try:
             rows = self._conn.execute(query, params).fetchall()
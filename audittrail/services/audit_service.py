@@ -7,9 +7,10 @@ Vereint Compliance-Audit und Application Logging.
 Author: QMToolV6 Development Team
 Version: 1.1.0
 """
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 import json
+import logging
 
 from audittrail.services.audit_service_interface import AuditServiceInterface
 from audittrail.dto.audit_dto import AuditLogDTO, CreateAuditLogDTO, AuditLogFilterDTO
@@ -21,6 +22,17 @@ from audittrail. exceptions.audit_exceptions import (
     ExportFormatException,
 )
 
+logger = logging.getLogger(__name__)
+
+# Rangfolge der LogLevels (für Min-Log-Level-Vergleiche)
+_LOG_LEVEL_ORDER: Dict[LogLevel, int] = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+    LogLevel.CRITICAL: 4,
+}
+
 
 class AuditService(AuditServiceInterface):
     """
@@ -47,6 +59,9 @@ class AuditService(AuditServiceInterface):
         self._min_log_level_global:  LogLevel = LogLevel.INFO
         # feature-spezifische Overrides
         self._min_log_level_per_feature: Dict[str, LogLevel] = {}
+        # dieselben Werte als Rang (int) für den Fast-Path in is_enabled()
+        self._min_log_order_global: int = _LOG_LEVEL_ORDER[self._min_log_level_global]
+        self._min_log_order_per_feature: Dict[str, int] = {}
 
         # ===== Retention Config =====
         # globale Default-Retention (in Tagen)
@@ -54,6 +69,12 @@ class AuditService(AuditServiceInterface):
         # optionale feature-spezifische Retention-Werte (Cache)
         self._retention_days:  Dict[str, int] = {}
 
+        # ===== Feature-Audit-Config Cache =====
+        # normalisierte "audit"-Sektion je Feature, zusammen mit dem Meta-Objekt,
+        # aus dem sie stammt; liefert der Configurator nach einem Re-Parse der
+        # meta.json ein anderes Objekt, ist der Eintrag veraltet
+        self._feature_audit_configs: Dict[str, Tuple[Any, Dict]] = {}
+
     # ===== Public API =====
 
     def log(
@@ -70,8 +91,8 @@ class AuditService(AuditServiceInterface):
         function: Optional[str] = None,
     ) -> int:
         """Zentrale Log-Methode."""
-        # 1. Min-Log-Level prüfen
-        if not self._should_log(feature, log_level):
+        # 1. Min-Log-Level prüfen (vor jeder Allokation)
+        if not self.is_enabled(feature, log_level):
             return -1
 
         # 2. DTO bauen
@@ -262,11 +283,85 @@ class AuditService(AuditServiceInterface):
         """
         if feature:
             self._min_log_level_per_feature[feature] = level
+            self._min_log_order_per_feature[feature] = _LOG_LEVEL_ORDER[level]
         else:
             self._min_log_level_global = level
+            self._min_log_order_global = _LOG_LEVEL_ORDER[level]
+
+    def is_enabled(self, feature: str, log_level: LogLevel) -> bool:
+        """
+        Prüft, ob ein Log mit diesem Level für das Feature gespeichert würde.
+
+        Analog zu logging.Logger.isEnabledFor(): Aufrufer können damit teure
+        details-Berechnungen überspringen.
+
+        Example:
+            >>> if audit.is_enabled("documents", LogLevel.DEBUG):
+            ...     audit.log(1, "DUMP", "documents", LogLevel.DEBUG, details=build_dump())
+        """
+        min_order = self._min_log_order_per_feature.get(feature, self._min_log_order_global)
+        return _LOG_LEVEL_ORDER.get(log_level, 0) >= min_order
 
     def get_feature_audit_config(self, feature: str) -> Dict:
-        """Audit-Config aus meta.json laden."""
+        """
+        Audit-Config aus meta.json laden.
+
+        Die normalisierte Config wird pro Feature gecacht, solange der
+        Configurator dasselbe Meta-Objekt liefert (dessen Descriptor-Cache
+        prüft mtime bzw. watchdog-Events); Fehler werden nicht gecacht.
+        Zurückgegeben wird eine Kopie.
+        """
+        config = self._cached_feature_audit_config(feature)
+        return {**config, "critical_actions": list(config["critical_actions"])}
+
+    def preload_feature_audit_configs(self, features: List[str]) -> None:
+        """
+        Lädt die Audit-Config mehrerer Features vorab in den Cache.
+
+        Wird beim Bootstrap mit den entdeckten Feature-IDs aufgerufen.
+        Features ohne meta.json werden übersprungen. Ungültige Werte in der
+        audit-Sektion (z.B. nicht-numerische retention_days) werden geloggt
+        und nicht gecacht; für diese Features gelten weiter die Defaults bzw.
+        die Fehlerbehandlung beim späteren Einzelzugriff.
+        """
+        for feature in features:
+            try:
+                self._cached_feature_audit_config(feature)
+            except FeatureNotFoundException:
+                continue
+            except (ValueError, TypeError) as e:
+                logger.warning("Invalid audit config for feature %s, skipping preload: %s", feature, e)
+
+    def invalidate_feature_audit_config(self, feature: Optional[str] = None) -> None:
+        """
+        Verwirft gecachte Audit-Configs (z.B. nach Änderung einer meta.json).
+
+        Args:
+            feature: Nur dieses Feature verwerfen; None → alle
+        """
+        if feature is None:
+            self._feature_audit_configs.clear()
+            self._retention_days.clear()
+        else:
+            self._feature_audit_configs.pop(feature, None)
+            self._retention_days.pop(feature, None)
+
+    # ===== Private Helper Methods =====
+
+    def _cached_feature_audit_config(self, feature: str) -> Dict:
+        """Gecachte Audit-Config; neu normalisiert, wenn sich das Meta-Objekt geändert hat."""
+        meta = self._load_feature_meta(feature)
+        cached = self._feature_audit_configs.get(feature)
+        if cached is not None and cached[0] is meta:
+            return cached[1]
+
+        config = self._parse_audit_config(meta)
+        self._feature_audit_configs[feature] = (meta, config)
+        self._retention_days.pop(feature, None)
+        return config
+
+    def _load_feature_meta(self, feature: str) -> Any:
+        """Meta des Features vom Configurator (Fehler als FeatureNotFoundException)."""
         try:
             meta = self._configurator.get_feature_meta(feature)
         except FileNotFoundError as e:
@@ -280,8 +375,27 @@ class AuditService(AuditServiceInterface):
                 f"Fehler beim Laden von Feature '{feature}': {str(e)}",
                 feature=feature
             ) from e
+        return meta
 
-        audit_cfg = meta.get("audit", {})
+    def _parse_audit_config(self, meta: Any) -> Dict:
+        """
+        Normalisiert die "audit"-Sektion.
+
+        meta ist das meta.json-Dict oder ein FeatureDescriptorDTO (so liefert
+        ConfiguratorService.get_feature_meta()).
+        """
+        if isinstance(meta, dict):
+            audit_cfg = meta.get("audit", {})
+        elif getattr(meta, "audit", None) is None:
+            audit_cfg = {}
+        else:
+            audit = meta.audit
+            audit_cfg = {
+                "must_audit": audit.must_audit,
+                "min_log_level": audit.min_log_level,
+                "critical_actions": audit.critical_actions or [],
+                "retention_days": audit.retention_days,
+            }
         must_audit = bool(audit_cfg.get("must_audit", False))
         min_log_level = str(audit_cfg.get("min_log_level", "INFO"))
         critical_actions = list(audit_cfg.get("critical_actions", []))
@@ -294,45 +408,6 @@ class AuditService(AuditServiceInterface):
             "retention_days": retention_days,
         }
 
-    # ===== Private Helper Methods =====
-
-    def _should_log(self, feature: str, log_level: LogLevel) -> bool:
-        """
-        Prüft, ob Log gespeichert werden soll (basierend auf Min-Log-Level).
-
-        FIX: Korrekter Enum-Vergleich über _compare_log_levels
-        """
-        feature_min = self._min_log_level_per_feature.get(feature)
-        effective_min = feature_min if feature_min is not None else self._min_log_level_global
-        return self._compare_log_levels(log_level, effective_min) >= 0
-
-    def _compare_log_levels(self, level1: LogLevel, level2: LogLevel) -> int:
-        """
-        Vergleicht zwei LogLevels.
-
-        Returns:
-            -1 wenn level1 < level2
-             0 wenn level1 == level2
-             1 wenn level1 > level2
-        """
-        level_order = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO:  1,
-            LogLevel. WARNING: 2,
-            LogLevel.ERROR: 3,
-            LogLevel.CRITICAL: 4,
-        }
-
-        order1 = level_order.get(level1, 0)
-        order2 = level_order.get(level2, 0)
-
-        if order1 < order2:
-            return -1
-        elif order1 > order2:
-            return 1
-        else:
-            return 0
-
     def _resolve_username(self, user_id:  int) -> str:
         """Fallback-Username-Resolution."""
         if user_id == 0:
@@ -29,17 +29,18 @@ class AuditPolicy:
 
     Note:
         Aktuell Placeholder - später Integration mit UserManagement/Roles.
+        Stateless: Alle Checks sind staticmethods, eine Instanz kann
+        beliebig geteilt werden.
     """
 
-    def __init__(self):
-        """Initialisiert Policy."""
-        # TODO: Integration mit UserManagement/Roles
-        # Aktuell: Hardcoded Admin-IDs (später aus DB)
-        self._admin_user_ids = [1]  # Vorläufig
-        self._qmb_user_ids = [2]    # Vorläufig
+    # TODO: Integration mit UserManagement/Roles
+    # Aktuell: Hardcoded Admin-IDs (später aus DB)
+    ADMIN_USER_IDS = frozenset({1})  # Vorläufig
+    QMB_USER_IDS = frozenset({2})    # Vorläufig
+    PRIVILEGED_USER_IDS = ADMIN_USER_IDS | QMB_USER_IDS
 
+    @staticmethod
     def can_read_logs(
-        self,
         user_id: int,
         filters: Optional[AuditLogFilterDTO] = None
     ) -> bool:
@@ -67,7 +68,7 @@ class AuditPolicy:
             return True
 
         # Admin/QMB hat vollen Zugriff
-        if self._is_admin_or_qmb(user_id):
+        if AuditPolicy._is_admin_or_qmb(user_id):
             return True
 
         # Normaler User: Nur eigene Logs
@@ -77,7 +78,8 @@ class AuditPolicy:
         # Wenn kein user_id-Filter: Nur Admin/QMB darf alle Logs sehen
         return False
 
-    def can_export_logs(self, user_id: int) -> bool:
+    @staticmethod
+    def can_export_logs(user_id: int) -> bool:
         """
         Prüft, ob User Logs exportieren darf.
 
@@ -91,10 +93,9 @@ class AuditPolicy:
             >>> policy.can_export_logs(1)  # True (Admin)
             >>> policy.can_export_logs(42)  # False (normaler User)
         """
-        return user_id == 0 or self._is_admin_or_qmb(user_id)
+        return user_id == 0 or AuditPolicy._is_admin_or_qmb(user_id)
 
-    def _is_admin_or_qmb(self, user_id: int) -> bool:
+    @staticmethod
+    def _is_admin_or_qmb(user_id: int) -> bool:
         """Prüft, ob User Admin oder QMB ist."""
-        # TODO: Integration mit UserManagement/Roles
-        # Aktuell: Hardcoded IDs
-        return user_id in self._admin_user_ids or user_id in self._qmb_user_ids
+        return user_id in AuditPolicy.PRIVILEGED_USER_IDS
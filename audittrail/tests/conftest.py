@@ -44,8 +44,20 @@ def audit_repository():
 
 
 @pytest.fixture
+def make_logs(audit_repository):
+    """Factory: legt n Logs per Bulk-Insert an (ohne Service/Policy)."""
+    def _make_logs(n, user_id=1, feature="auth", **kwargs):
+        dtos = [
+            CreateAuditLogDTO(user_id=user_id, feature=feature, action=f"LOG_{i}", **kwargs)
+            for i in range(n)
+        ]
+        return audit_repository.create_many(dtos)
+    return _make_logs
+
+
+@pytest.fixture(scope="session")
 def audit_policy():
-    """AuditPolicy-Instanz."""
+    """AuditPolicy-Instanz (stateless → einmal pro Test-Session)."""
     return AuditPolicy()
 
 
@@ -10,6 +10,7 @@ Author: QMToolV6 Development Team
 Version: 1.0.0
 """
 import pytest
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 
 from audittrail.dto.audit_dto import CreateAuditLogDTO, AuditLogDTO, AuditLogFilterDTO
@@ -100,6 +101,22 @@ class TestAuditLogFilterDTO:
         assert where_clause == "1=1"
         assert params == []
 
+    def test_sql_conditions_memoized(self):
+        """sql_conditions wird pro Instanz nur einmal gebaut."""
+        filters = AuditLogFilterDTO(user_id=42, feature="auth")
+
+        assert filters.sql_conditions is filters.sql_conditions
+        assert filters.to_sql_conditions() == (
+            filters.sql_conditions[0], [42, "auth"]
+        )
+
+    def test_filter_is_immutable(self):
+        """Filter ist frozen → Memo kann nicht veralten."""
+        filters = AuditLogFilterDTO(user_id=42)
+
+        with pytest.raises(FrozenInstanceError):
+            filters.user_id = 99
+
     def test_has_filters_true(self):
         """has_filters() erkennt gesetzte Filter."""
         filters = AuditLogFilterDTO(user_id=42)
@@ -245,11 +245,10 @@ class TestAuditIntegration:
             # Mindestens der neue Log
             assert any(log.action == "NEW" for log in logs)
 
-    def test_pagination(self, audit_service):
+    def test_pagination(self, audit_service, make_logs):
         """Pagination mit limit/offset."""
         # 10 Logs erstellen
-        for i in range(10):
-            audit_service.log(1, f"LOG_{i}", "auth")
+        make_logs(10)
 
         # Erste 5 abrufen
         with patch.object(audit_service, '_get_current_user_id', return_value=0):
@@ -19,9 +19,9 @@ class TestAuditPolicy:
     """Tests für AuditPolicy."""
 
     @pytest.fixture
-    def policy(self):
-        """Policy-Instanz."""
-        return AuditPolicy()
+    def policy(self, audit_policy):
+        """Geteilte Policy-Instanz aus conftest (stateless)."""
+        return audit_policy
 
     # ===== can_read_logs() Tests =====
 
@@ -70,3 +70,11 @@ class TestAuditPolicy:
     def test_normal_user_cannot_export(self, policy):
         """Normaler User kann NICHT exportieren."""
         assert policy.can_export_logs(42) is False
+
+    # ===== Stateless =====
+
+    def test_checks_work_without_instance(self):
+        """Checks sind staticmethods → kein Instanz-State nötig."""
+        assert AuditPolicy.can_export_logs(1) is True
+        assert AuditPolicy.can_read_logs(42, AuditLogFilterDTO(user_id=42)) is True
+        assert AuditPolicy.can_read_logs(42, None) is False
@@ -25,6 +25,27 @@ class TestAuditRepository:
 
         assert log_id > 0
 
+    def test_create_many(self, audit_repository):
+        """Mehrere Logs in einer Transaktion erstellen."""
+        dtos = [
+            CreateAuditLogDTO(user_id=42, feature="auth", action=f"LOG_{i}")
+            for i in range(3)
+        ]
+
+        assert audit_repository.create_many(dtos) == 3
+        assert len(audit_repository.find_by_filters(AuditLogFilterDTO(user_id=42))) == 3
+
+    def test_create_many_invalid_writes_nothing(self, audit_repository):
+        """Ungültiges DTO → kein Log wird geschrieben."""
+        dtos = [
+            CreateAuditLogDTO(user_id=42, feature="auth", action="OK"),
+            CreateAuditLogDTO(user_id=42, feature="auth", action=""),
+        ]
+
+        with pytest.raises(ValueError):
+            audit_repository.create_many(dtos)
+        assert audit_repository.find_by_filters(AuditLogFilterDTO()) == []
+
     def test_find_by_filters_user_id(self, audit_repository, sample_log_dto):
         """Logs nach user_id filtern."""
         # Log erstellen
@@ -81,7 +102,39 @@ class TestAuditRepository:
         logs = audit_repository.search("AUTH_FAILED")
 
         assert len(logs) == 1
-        assert "AUTH_FAILED" in str(logs[0].details)
+        assert logs[0].details["error_code"] == "AUTH_FAILED"
+
+    def test_search_in_nested_details(self, audit_repository):
+        """Suche findet verschachtelte Werte und Keys, nicht JSON-Syntax."""
+        audit_repository.create(CreateAuditLogDTO(
+            user_id=42,
+            feature="auth",
+            action="TEST",
+            details={"context": {"reason": "LOCKED_OUT"}, "attempts": [1, 2]}
+        ))
+
+        assert len(audit_repository.search("LOCKED_OUT")) == 1
+        assert len(audit_repository.search("reason")) == 1
+        assert len(audit_repository.search('":')) == 0
+
+    def test_search_ignores_array_indices(self, audit_repository):
+        """Array-Indizes in details sind keine Keys und liefern keine Treffer."""
+        audit_repository.create(CreateAuditLogDTO(
+            user_id=42, feature="auth", action="TEST", details={"tags": ["x", "y"]}
+        ))
+
+        assert audit_repository.search("1") == []
+        assert len(audit_repository.search("tags")) == 1
+
+    def test_search_skips_malformed_details(self, audit_repository):
+        """Ungültiges JSON in details bricht die Suche nicht ab."""
+        audit_repository.create(CreateAuditLogDTO(
+            user_id=42, feature="auth", action="TEST", details={"k": "v"}
+        ))
+        audit_repository._conn.execute("UPDATE audit_logs SET details = '{broken'")
+
+        assert audit_repository.search("broken") == []
+        assert len(audit_repository.search("TEST")) == 1
 
     def test_delete_before(self, audit_repository, sample_log_dto):
         """Alte Logs löschen."""
@@ -16,6 +16,8 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 from audittrail.services. audit_service import AuditService
+from configurator.dto.audit_config_dto import AuditConfigDTO
+from configurator.dto.feature_descriptor_dto import FeatureDescriptorDTO
 from audittrail.dto.audit_dto import CreateAuditLogDTO, AuditLogFilterDTO
 from audittrail.enum.audit_enum import LogLevel, AuditSeverity, AuditActionType
 from audittrail.exceptions.audit_exceptions import (
@@ -287,6 +289,25 @@ class TestAuditService:
         log_id = audit_service.log(1, "TEST", "documents", log_level=LogLevel.INFO)
         assert log_id > 0
 
+    def test_is_enabled_respects_feature_override(self, audit_service):
+        """is_enabled() folgt globalem und feature-spezifischem Min-Level."""
+        audit_service.set_min_log_level(LogLevel.ERROR, feature="auth")
+
+        assert audit_service.is_enabled("auth", LogLevel.WARNING) is False
+        assert audit_service.is_enabled("auth", LogLevel.ERROR) is True
+        assert audit_service.is_enabled("documents", LogLevel.INFO) is True
+        assert audit_service.is_enabled("documents", LogLevel.DEBUG) is False
+
+    def test_log_below_min_level_skips_dto(self, audit_service):
+        """Gefilterte Logs bauen kein DTO und treffen die DB nicht."""
+        with patch("audittrail.services.audit_service.CreateAuditLogDTO") as dto_cls, \
+                patch.object(audit_service._repository, "create") as create:
+            log_id = audit_service.log(1, "TEST", "auth", log_level=LogLevel.DEBUG)
+
+        assert log_id == -1
+        dto_cls.assert_not_called()
+        create.assert_not_called()
+
     # ===== get_feature_audit_config() Tests =====
 
     def test_get_feature_audit_config_success(self, audit_service):
@@ -306,6 +327,90 @@ class TestAuditService:
 
         assert exc_info.value.feature == "invalid_feature"
 
+    def test_get_feature_audit_config_cached(self, audit_service):
+        """Unverändertes Meta-Objekt wird pro Feature nur einmal normalisiert."""
+        with patch.object(
+            audit_service, "_parse_audit_config", wraps=audit_service._parse_audit_config
+        ) as parse:
+            audit_service.get_feature_audit_config("auth")
+            config = audit_service.get_feature_audit_config("auth")
+        config["critical_actions"].append("MUTATED")
+
+        assert parse.call_count == 1
+        assert "MUTATED" not in audit_service.get_feature_audit_config("auth")["critical_actions"]
+
+    def test_get_feature_audit_config_follows_reparsed_meta(self, audit_service, mock_configurator):
+        """Liefert der Configurator ein neues Meta-Objekt (geänderte meta.json), gilt die neue Config."""
+        audit_service.get_feature_audit_config("auth")
+
+        mock_configurator.get_feature_meta.return_value = {
+            "audit": {"min_log_level": "ERROR", "critical_actions": ["DELETE"]}
+        }
+        config = audit_service.get_feature_audit_config("auth")
+
+        assert config["min_log_level"] == "ERROR"
+        assert config["critical_actions"] == ["DELETE"]
+
+    def test_get_feature_audit_config_from_descriptor(self, audit_service, mock_configurator):
+        """FeatureDescriptorDTO (ConfiguratorService.get_feature_meta) wird wie das Dict gelesen."""
+        mock_configurator.get_feature_meta.return_value = FeatureDescriptorDTO(
+            id="auth",
+            label="Auth",
+            version="1.0.0",
+            main_class="auth.Service",
+            audit=AuditConfigDTO(must_audit=True, min_log_level="WARNING", retention_days=30),
+        )
+
+        config = audit_service.get_feature_audit_config("auth")
+
+        assert config == {
+            "must_audit": True,
+            "min_log_level": "WARNING",
+            "critical_actions": [],
+            "retention_days": 30,
+        }
+
+    def test_invalidate_feature_audit_config(self, audit_service, mock_configurator):
+        """Nach Invalidierung wird meta.json neu gelesen."""
+        audit_service.get_feature_audit_config("auth")
+
+        audit_service.invalidate_feature_audit_config("auth")
+        audit_service.get_feature_audit_config("auth")
+
+        assert mock_configurator.get_feature_meta.call_count == 2
+
+    def test_preload_feature_audit_configs(self, audit_service, mock_configurator):
+        """Preload füllt den Cache, fehlende Features werden übersprungen."""
+        auth_meta = {"audit": {"must_audit": True}}
+
+        def get_feature_meta(feature):
+            if feature != "auth":
+                raise FileNotFoundError(feature)
+            return auth_meta
+
+        mock_configurator.get_feature_meta.side_effect = get_feature_meta
+
+        audit_service.preload_feature_audit_configs(["auth", "missing"])
+        with patch.object(audit_service, "_parse_audit_config") as parse:
+            config = audit_service.get_feature_audit_config("auth")
+
+        assert config["must_audit"] is True
+        parse.assert_not_called()
+
+    def test_preload_skips_invalid_audit_config(self, audit_service, mock_configurator):
+        """Ungültige audit-Werte brechen den Preload nicht ab; Retention fällt auf Default."""
+        def get_feature_meta(feature):
+            if feature == "broken":
+                return {"audit": {"retention_days": "not_a_number"}}
+            return {"audit": {"must_audit": True}}
+
+        mock_configurator.get_feature_meta.side_effect = get_feature_meta
+
+        audit_service.preload_feature_audit_configs(["broken", "auth"])
+
+        assert audit_service.get_feature_audit_config("auth")["must_audit"] is True
+        assert audit_service._get_feature_retention_days("broken") == 365
+
     # ===== Helper Methods Tests =====
 
     def test_resolve_username_fallback(self, audit_service):
@@ -6,14 +6,14 @@ from typing import Optional
 from ..enum.auth_enum import SessionStatus
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoginRequestDTO:
     """DTO für Login-Anfrage."""
     username: str
     password: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionDTO:
     """DTO für Session-Informationen."""
     session_id: str
@@ -26,7 +26,7 @@ class SessionDTO:
     user_agent: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthenticationResultDTO:
     """DTO für Authentifizierungs-Ergebnis."""
     success: bool
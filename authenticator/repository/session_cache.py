@@ -0,0 +1,111 @@
+"""Cache-Backends für Session-Lookups."""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Protocol
+import threading
+import time
+
+from ..dto.auth_dto import SessionDTO
+
+
+class SessionCacheBackend(Protocol):
+    """
+    Schnittstelle für Session-Caches.
+
+    Prozesslokal über InMemorySessionCache; für mehrere Prozesse kann ein
+    geteiltes Backend (z.B. Redis mit GET/SETEX) dieselbe Schnittstelle
+    implementieren.
+    """
+
+    def get(self, session_id: str) -> Optional[SessionDTO]:
+        """Liefert die gecachte Session oder None."""
+        ...
+
+    def set(self, session: SessionDTO) -> None:
+        """Legt eine Session ab."""
+        ...
+
+    def delete(self, session_id: str) -> None:
+        """Entfernt eine Session."""
+        ...
+
+    def delete_user(self, user_id: int) -> None:
+        """Entfernt alle Sessions eines Benutzers."""
+        ...
+
+    def clear(self) -> None:
+        """Leert den Cache."""
+        ...
+
+
+class InMemorySessionCache:
+    """
+    Prozesslokaler TTL-/LRU-Cache für SessionDTOs.
+
+    Ein Eintrag lebt höchstens ttl_seconds und nie über expires_at der
+    Session hinaus; abgelaufene Sessions werden so immer aus der Datenbank
+    (mit Status EXPIRED) gelesen.
+
+    Invalidierung wirkt nur auf Repositories, die dieselbe Cache-Instanz
+    nutzen (Default: eine pro Engine und Prozess). Änderungen über andere
+    Prozesse oder an der Datenbank vorbei (direktes SQL, Rollback einer
+    äußeren Transaktion) werden erst nach spätestens ttl_seconds sichtbar.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl_seconds: float = 60.0):
+        """
+        Initialisiert den Cache.
+
+        Args:
+            max_size: Max. Anzahl Einträge (älteste werden verdrängt)
+            ttl_seconds: Max. Lebensdauer eines Eintrags
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[SessionDTO, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[SessionDTO]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+
+            session, cached_until = entry
+            if cached_until <= time.monotonic():
+                del self._entries[session_id]
+                return None
+
+            self._entries.move_to_end(session_id)
+            return session
+
+    def set(self, session: SessionDTO) -> None:
+        remaining = (session.expires_at - datetime.now()).total_seconds()
+        ttl = min(self.ttl_seconds, remaining)
+        if ttl <= 0:
+            self.delete(session.session_id)
+            return
+
+        cached_until = time.monotonic() + ttl
+        with self._lock:
+            self._entries[session.session_id] = (session, cached_until)
+            self._entries.move_to_end(session.session_id)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def delete_user(self, user_id: int) -> None:
+        with self._lock:
+            stale = [sid for sid, (session, _) in self._entries.items() if session.user_id == user_id]
+            for session_id in stale:
+                del self._entries[session_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,24 +1,131 @@
 """Repository für Session-Verwaltung."""
 from datetime import datetime, timedelta
-from typing import Optional
-import secrets
-
-from sqlalchemy import Column, Integer, String, DateTime, select
+from typing import List, Optional, Union
+import base64
+import os
+import threading
+import time
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import DDL, Column, Integer, String, DateTime, Index, Row, bindparam, event, select, delete
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from shared.database.base import Base
 from ..dto.auth_dto import SessionDTO
 from ..enum.auth_enum import SessionStatus
 from ..exceptions import SessionNotFoundException
+from .session_cache import InMemorySessionCache, SessionCacheBackend
+
+# Lokale Aliase für den Status-Vergleich in _entity_to_dto
+_STATUS_ACTIVE = SessionStatus.ACTIVE
+_STATUS_EXPIRED = SessionStatus.EXPIRED
+
+
+# Zuletzt gelesene Wanduhrzeit (monotonic-Zeitpunkt, datetime)
+_WALL_CLOCK_CACHE: tuple[float, datetime] = (float("-inf"), datetime.min)
+_WALL_CLOCK_RESOLUTION = 0.001
+
+
+def _now_cached() -> datetime:
+    """
+    datetime.now() mit Millisekunden-Auflösung.
+
+    Innerhalb von _WALL_CLOCK_RESOLUTION Sekunden wird derselbe Wert
+    geliefert; für Session-Zeitstempel und Ablaufprüfung genau genug.
+    """
+    global _WALL_CLOCK_CACHE
+    mono = time.monotonic()
+    cached_mono, cached_now = _WALL_CLOCK_CACHE
+    if mono - cached_mono < _WALL_CLOCK_RESOLUTION:
+        return cached_now
+    now = datetime.now()
+    _WALL_CLOCK_CACHE = (mono, now)
+    return now
+
+
+class _TokenPool:
+    """
+    Vorrat an Zufallsbytes für Session-IDs.
+
+    Liest os.urandom blockweise statt pro Session. Nach os.fork() wird der
+    Vorrat im Kind verworfen, damit Eltern und Kind keine IDs teilen.
+
+    Format: 12 Hex-Zeichen Unix-Zeit in ms + secrets.token_urlsafe(TOKEN_BYTES).
+    Das Zeitpräfix (wie bei UUIDv7) sortiert neue IDs ans Ende des
+    session_id-Index, statt sie zufällig über den B-Tree zu verteilen; die
+    volle Zufallsentropie bleibt im Suffix erhalten.
+
+    Achtung: Das Präfix ist nicht geheim. Wer eine Session-ID kennt, kann
+    daraus den Erstellungszeitpunkt der Session (auf die Millisekunde)
+    ablesen. Die Unvorhersagbarkeit der ID hängt allein am Suffix.
+    """
+
+    TOKEN_BYTES = 32
+    BATCH_SIZE = 256
+    TIME_PREFIX_CHARS = 12
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+    def next_token(self) -> str:
+        """Liefert eine neue URL-sichere Session-ID."""
+        with self._lock:
+            if self._offset + self.TOKEN_BYTES > len(self._buffer):
+                self._buffer = os.urandom(self.TOKEN_BYTES * self.BATCH_SIZE)
+                self._offset = 0
+            start = self._offset
+            self._offset += self.TOKEN_BYTES
+            raw = self._buffer[start:self._offset]
+        prefix = format(time.time_ns() // 1_000_000, f"0{self.TIME_PREFIX_CHARS}x")
+        return prefix + base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    def reset(self) -> None:
+        """Verwirft den aktuellen Vorrat."""
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._offset = 0
+
+
+_TOKEN_POOL = _TokenPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_TOKEN_POOL.reset)
+
+# Default-Caches je Engine: SessionRepository-Instanzen ohne eigenes Backend
+# auf derselben Datenbank teilen einen Cache (ein Logout über eine Instanz
+# wirkt sofort für alle), Sessions einer anderen Datenbank sind darin nie
+# sichtbar. Weak-Keys: mit der Engine verschwindet auch ihr Cache.
+_DEFAULT_SESSION_CACHES: "WeakKeyDictionary[Engine, InMemorySessionCache]" = WeakKeyDictionary()
+_DEFAULT_SESSION_CACHES_LOCK = threading.Lock()
+
+
+def _default_session_cache(db_session: Session) -> InMemorySessionCache:
+    """Liefert den Default-Cache der Engine, an die db_session gebunden ist."""
+    bind = db_session.get_bind()
+    # An eine Connection gebundene Sessions teilen den Cache ihrer Engine
+    engine = getattr(bind, "engine", bind)
+    with _DEFAULT_SESSION_CACHES_LOCK:
+        cache = _DEFAULT_SESSION_CACHES.get(engine)
+        if cache is None:
+            cache = _DEFAULT_SESSION_CACHES[engine] = InMemorySessionCache()
+        return cache
 
 
 class SessionEntity(Base):
     """SQLAlchemy Entity für Sessions."""
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Deckt auch reine user_id-Abfragen ab (führende Spalte)
+        Index("ix_sessions_user_expires", "user_id", "expires_at"),
+        # Für Ablauf-Sweeps über expires_at
+        Index("ix_sessions_expires_at", "expires_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(String(64), unique=True, nullable=False, index=True)
-    user_id = Column(Integer, nullable=False, index=True)
+    user_id = Column(Integer, nullable=False)
     username = Column(String(50), nullable=False)
     created_at = Column(DateTime, nullable=False)
     expires_at = Column(DateTime, nullable=False)
@@ -26,17 +133,70 @@ class SessionEntity(Base):
     user_agent = Column(String(255), nullable=True)
 
 
+# PostgreSQL: Hash-Index für reine Gleichheits-Lookups auf session_id
+# (kleiner als der B-Tree des Unique-Constraints). Andere Backends behalten
+# nur den B-Tree.
+event.listen(
+    SessionEntity.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_sessions_session_id_hash "
+        "ON sessions USING HASH (session_id)"
+    ).execute_if(dialect="postgresql")
+)
+
+
 class SessionRepository:
     """Repository für Session-Operationen."""
 
-    def __init__(self, db_session: Session):
+    # Spalten, die für ein SessionDTO benötigt werden
+    _DTO_COLUMNS = (
+        SessionEntity.session_id,
+        SessionEntity.user_id,
+        SessionEntity.username,
+        SessionEntity.created_at,
+        SessionEntity.expires_at,
+        SessionEntity.ip_address,
+        SessionEntity.user_agent,
+    )
+
+    # Einmal gebaute Statements mit Bind-Parametern: pro Aufruf entfällt der
+    # Aufbau des Statement-Baums, SQLAlchemy trifft direkt den Compiled-Cache.
+    _GET_SESSION_STMT = (
+        select(*_DTO_COLUMNS)
+        .where(SessionEntity.session_id == bindparam("session_id"))
+    )
+    _GET_USER_SESSIONS_STMT = (
+        select(*_DTO_COLUMNS)
+        .where(SessionEntity.user_id == bindparam("user_id"))
+        .order_by(SessionEntity.created_at.desc())
+    )
+    _DELETE_SESSION_STMT = (
+        delete(SessionEntity)
+        .where(SessionEntity.session_id == bindparam("session_id"))
+        .execution_options(synchronize_session=False)
+    )
+    _DELETE_USER_SESSIONS_STMT = (
+        delete(SessionEntity)
+        .where(SessionEntity.user_id == bindparam("user_id"))
+        .execution_options(synchronize_session=False)
+    )
+
+    def __init__(
+        self,
+        db_session: Session,
+        cache: Optional[SessionCacheBackend] = None
+    ):
         """
         Initialisiert das Repository.
 
         Args:
             db_session: SQLAlchemy Session
+            cache: Cache für get_session (Default: InMemorySessionCache, den
+                   alle Repositories auf derselben Engine teilen)
         """
         self._db_session = db_session
+        self._cache = cache if cache is not None else _default_session_cache(db_session)
 
     def create_session(
         self,
@@ -59,8 +219,8 @@ class SessionRepository:
         Returns:
             SessionDTO mit Session-Informationen
         """
-        now = datetime.now()
-        session_id = secrets.token_urlsafe(32)
+        now = _now_cached()
+        session_id = _TOKEN_POOL.next_token()
 
         entity = SessionEntity(
             session_id=session_id,
@@ -76,12 +236,16 @@ class SessionRepository:
         self._db_session.commit()
         self._db_session.refresh(entity)
 
-        return self._entity_to_dto(entity)
+        session = self._entity_to_dto(entity, now)
+        self._cache.set(session)
+        return session
 
     def get_session(self, session_id: str) -> SessionDTO:
         """
         Lädt eine Session anhand der Session-ID.
 
+        Treffer im Cache werden ohne Datenbankzugriff geliefert.
+
         Args:
             session_id: Session-ID
 
@@ -91,13 +255,39 @@ class SessionRepository:
         Raises:
             SessionNotFoundException: Wenn Session nicht gefunden wurde
         """
-        stmt = select(SessionEntity).where(SessionEntity.session_id == session_id)
-        entity = self._db_session.execute(stmt).scalar_one_or_none()
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            return cached
 
-        if not entity:
+        # Nur die DTO-Spalten als Row laden (keine Entity-Hydrierung / Identity-Map)
+        row = self._db_session.execute(
+            self._GET_SESSION_STMT, {"session_id": session_id}
+        ).first()
+
+        if row is None:
             raise SessionNotFoundException(f"Session mit ID {session_id} nicht gefunden")
 
-        return self._entity_to_dto(entity)
+        session = self._entity_to_dto(row)
+        self._cache.set(session)
+        return session
+
+    def get_user_sessions(self, user_id: int) -> List[SessionDTO]:
+        """
+        Lädt alle Sessions eines Benutzers.
+
+        Args:
+            user_id: ID des Benutzers
+
+        Returns:
+            Liste von SessionDTOs (neueste zuerst)
+        """
+        rows = self._db_session.execute(
+            self._GET_USER_SESSIONS_STMT, {"user_id": user_id}
+        ).all()
+
+        now = _now_cached()
+        to_dto = self._entity_to_dto
+        return [to_dto(row, now) for row in rows]
 
     def delete_session(self, session_id: str) -> None:
         """
@@ -109,13 +299,15 @@ class SessionRepository:
         Raises:
             SessionNotFoundException: Wenn Session nicht gefunden wurde
         """
-        stmt = select(SessionEntity).where(SessionEntity.session_id == session_id)
-        entity = self._db_session.execute(stmt).scalar_one_or_none()
+        self._cache.delete(session_id)
+        result = self._db_session.execute(
+            self._DELETE_SESSION_STMT, {"session_id": session_id}
+        )
 
-        if not entity:
+        if result.rowcount == 0:
+            self._db_session.rollback()
             raise SessionNotFoundException(f"Session mit ID {session_id} nicht gefunden")
 
-        self._db_session.delete(entity)
         self._db_session.commit()
 
     def delete_user_sessions(self, user_id: int) -> int:
@@ -128,20 +320,71 @@ class SessionRepository:
         Returns:
             Anzahl gelöschter Sessions
         """
-        stmt = select(SessionEntity).where(SessionEntity.user_id == user_id)
-        entities = self._db_session.execute(stmt).scalars().all()
-
-        count = len(entities)
-        for entity in entities:
-            self._db_session.delete(entity)
+        self._cache.delete_user(user_id)
+        result = self._db_session.execute(
+            self._DELETE_USER_SESSIONS_STMT, {"user_id": user_id}
+        )
 
         self._db_session.commit()
-        return count
+        return result.rowcount
 
-    def _entity_to_dto(self, entity: SessionEntity) -> SessionDTO:
-        """Konvertiert Entity zu DTO."""
-        now = datetime.now()
-        status = SessionStatus.ACTIVE if entity.expires_at > now else SessionStatus.EXPIRED
+    def delete_expired_sessions(
+        self,
+        now: Optional[datetime] = None,
+        batch_size: int = 10_000
+    ) -> int:
+        """
+        Löscht alle abgelaufenen Sessions in Batches.
+
+        Jeder Batch ist ein eigenes DELETE mit Commit, damit die Tabelle
+        nicht lange gesperrt bleibt. Nutzt den Index auf expires_at.
+
+        Args:
+            now: Stichtag (Default: datetime.now())
+            batch_size: Max. Anzahl gelöschter Sessions pro Batch
+
+        Returns:
+            Anzahl gelöschter Sessions
+        """
+        if now is None:
+            now = datetime.now()
+
+        expired_ids = (
+            select(SessionEntity.id)
+            .where(SessionEntity.expires_at < now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(SessionEntity)
+            .where(SessionEntity.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+        total = 0
+        while True:
+            result = self._db_session.execute(stmt)
+            self._db_session.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+
+    def _entity_to_dto(
+        self,
+        entity: Union[SessionEntity, Row],
+        now: Optional[datetime] = None
+    ) -> SessionDTO:
+        """
+        Konvertiert Entity (oder Row mit _DTO_COLUMNS) zu DTO.
+
+        Args:
+            entity: Session-Entity oder Row mit gleichnamigen Attributen
+            now: Referenzzeitpunkt für den Status; beim Konvertieren mehrerer
+                 Entities einmal berechnen und durchreichen
+        """
+        if now is None:
+            now = _now_cached()
+        status = _STATUS_ACTIVE if entity.expires_at > now else _STATUS_EXPIRED
 
         return SessionDTO(
             session_id=entity.session_id,
@@ -1,5 +1,12 @@
 """Authenticator Service Implementation."""
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Union
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
 import bcrypt
 
 from sqlalchemy.orm import Session
@@ -9,15 +16,43 @@ from ..repository.session_repository import SessionRepository
 from .authenticator_service_interface import AuthenticatorServiceInterface
 from .policy.authenticator_policy import AuthenticatorPolicy
 from ..exceptions import (
+    AuthenticatorException,
     InvalidCredentialsException,
     PasswordHashingException,
     SessionNotFoundException
 )
 
+try:  # optional: argon2id-Hashes (argon2-cffi)
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerificationError, InvalidHashError
+    _ARGON2_HASHER: Optional["PasswordHasher"] = PasswordHasher()
+except ImportError:
+    _ARGON2_HASHER = None
+
+logger = logging.getLogger(__name__)
+
+# Einheitliche Antwort für alle ungültigen Logins (verrät nicht, ob der
+# Benutzer existiert); immutable → kann geteilt werden.
+_FAILED_LOGIN_RESULT = AuthenticationResultDTO(
+    success=False,
+    error_message="Ungültige Anmeldedaten"
+)
+
+# bcrypt-Hash (cost 12) eines nicht verwendeten Passworts. Wird bei
+# unbekanntem Benutzer geprüft, damit die Antwortzeit gleich bleibt.
+_DUMMY_PASSWORD_HASH = b"$2b$12$bwJ0hPP.aNTxwTgQW6kmpuwwTTXjGU1ojVhTcO5g65vKqSdlTowqy"
+
 
 class AuthenticatorService(AuthenticatorServiceInterface):
     """Service für Authentifizierung."""
 
+    # Max. Anzahl gemerkter erfolgreicher Passwort-Verifikationen
+    VERIFY_CACHE_SIZE = 1024
+    # Lebensdauer eines gemerkten Verifikations-Ergebnisses (Sekunden)
+    VERIFY_CACHE_TTL_SECONDS = 30.0
+    # Mindestabstand zwischen zwei automatischen Ablauf-Sweeps (Sekunden)
+    EXPIRED_SESSION_SWEEP_INTERVAL = 3600.0
+
     def __init__(
         self,
         db_session: Session,
@@ -34,6 +69,16 @@ class AuthenticatorService(AuthenticatorServiceInterface):
         self._user_repository = user_repository
         self._policy = AuthenticatorPolicy()
 
+        # LRU-Cache erfolgreicher bcrypt-Prüfungen (Wert: gültig bis, monotonic).
+        # Key ist (Hash, HMAC des Klartexts mit prozesslokalem Secret) → Klartext
+        # wird nie gespeichert. Ein neuer Hash (Passwortänderung) erzeugt
+        # automatisch einen neuen Key.
+        self._verify_cache: "OrderedDict[tuple[bytes, bytes], float]" = OrderedDict()
+        self._verify_cache_secret = secrets.token_bytes(32)
+        self._verify_cache_lock = threading.Lock()
+
+        self._last_session_sweep = time.monotonic()
+
     def login(
         self,
         login_request: LoginRequestDTO,
@@ -61,8 +106,14 @@ class AuthenticatorService(AuthenticatorServiceInterface):
             # Benutzer laden
             user = self._user_repository.get_by_username(login_request.username)
 
-            # Passwort prüfen
-            if not self._verify_password(login_request.password, user.password_hash):
+            # Passwort prüfen (auch bei unbekanntem Benutzer → gleiche Laufzeit)
+            if user is None:
+                self._verify_password(login_request.password, _DUMMY_PASSWORD_HASH)
+                raise InvalidCredentialsException("Unbekannter Benutzer")
+
+            # password_hash_bytes nur bei UserEntity; andere User-Objekte liefern str
+            password_hash = getattr(user, "password_hash_bytes", None) or user.password_hash
+            if not self._verify_password(login_request.password, password_hash):
                 raise InvalidCredentialsException("Ungültige Anmeldedaten")
 
             # Session erstellen
@@ -72,13 +123,19 @@ class AuthenticatorService(AuthenticatorServiceInterface):
                 ip_address=ip_address,
                 user_agent=user_agent
             )
+            self._maybe_cleanup_expired_sessions()
 
             return AuthenticationResultDTO(
                 success=True,
                 session=session
             )
 
-        except Exception as e:
+        except InvalidCredentialsException as e:
+            logger.debug("Login für '%s' abgelehnt: %s", login_request.username, e)
+            return _FAILED_LOGIN_RESULT
+
+        except AuthenticatorException as e:
+            logger.exception("Login für '%s' fehlgeschlagen", login_request.username)
             return AuthenticationResultDTO(
                 success=False,
                 error_message=str(e)
@@ -123,14 +180,49 @@ class AuthenticatorService(AuthenticatorServiceInterface):
         """
         return self._session_repository.get_session(session_id)
 
-    @staticmethod
-    def _verify_password(plain_password: str, password_hash: str) -> bool:
+    def cleanup_expired_sessions(self, batch_size: int = 1000) -> int:
+        """
+        Löscht abgelaufene Sessions (batchweise, über den expires_at-Index).
+
+        Für Cronjobs/Scheduler; login() stößt den Sweep zusätzlich höchstens
+        alle EXPIRED_SESSION_SWEEP_INTERVAL Sekunden an.
+
+        Args:
+            batch_size: Max. Anzahl gelöschter Sessions pro Batch
+
+        Returns:
+            Anzahl gelöschter Sessions
+        """
+        self._last_session_sweep = time.monotonic()
+        return self._session_repository.delete_expired_sessions(batch_size=batch_size)
+
+    def _maybe_cleanup_expired_sessions(self) -> None:
+        """
+        Startet den Ablauf-Sweep, wenn das Intervall verstrichen ist.
+
+        Der Sweep ist opportunistisch: Fehler (z.B. gesperrte DB) werden
+        geloggt und lassen den bereits erfolgreichen Login unberührt.
+        """
+        if time.monotonic() - self._last_session_sweep < self.EXPIRED_SESSION_SWEEP_INTERVAL:
+            return
+        try:
+            self.cleanup_expired_sessions()
+        except Exception as e:
+            logger.warning("Ablauf-Sweep für Sessions fehlgeschlagen: %s", e)
+
+    def _verify_password(self, plain_password: str, password_hash: Union[str, bytes]) -> bool:
         """
         Verifiziert ein Passwort gegen den Hash.
 
+        Erfolgreiche Prüfungen werden VERIFY_CACHE_TTL_SECONDS lang gecacht;
+        wiederholte Logins mit demselben Passwort sparen so den bcrypt-Aufwand.
+        Fehlschläge werden nicht gecacht und kosten immer einen vollen
+        bcrypt-Vergleich. Eine Passwortänderung liefert einen neuen Hash und
+        damit einen neuen Cache-Key; alte Einträge greifen nicht mehr.
+
         Args:
             plain_password: Klartext-Passwort
-            password_hash: Gespeicherter Hash
+            password_hash: Gespeicherter Hash (bevorzugt bereits als bytes)
 
         Returns:
             True wenn Passwort korrekt ist
@@ -139,9 +231,55 @@ class AuthenticatorService(AuthenticatorServiceInterface):
             PasswordHashingException: Bei Hashing-Fehler
         """
         try:
-            return bcrypt.checkpw(
-                plain_password.encode('utf-8'),
-                password_hash.encode('utf-8')
+            if isinstance(password_hash, str):
+                password_hash = password_hash.encode('utf-8')
+            plain_bytes = plain_password.encode('utf-8')
+            cache_key = (
+                password_hash,
+                hmac.new(self._verify_cache_secret, plain_bytes, hashlib.sha256).digest()
             )
+
+            with self._verify_cache_lock:
+                valid_until = self._verify_cache.get(cache_key)
+                if valid_until is not None:
+                    if valid_until > time.monotonic():
+                        self._verify_cache.move_to_end(cache_key)
+                        return True
+                    del self._verify_cache[cache_key]
+
+            verified = self._check_password_hash(plain_bytes, password_hash)
+        except PasswordHashingException:
+            raise
         except Exception as e:
             raise PasswordHashingException(f"Fehler bei Passwort-Verifikation: {e}")
+
+        if verified:
+            valid_until = time.monotonic() + self.VERIFY_CACHE_TTL_SECONDS
+            with self._verify_cache_lock:
+                self._verify_cache[cache_key] = valid_until
+                if len(self._verify_cache) > self.VERIFY_CACHE_SIZE:
+                    self._verify_cache.popitem(last=False)
+
+        return verified
+
+    @staticmethod
+    def _check_password_hash(plain_bytes: bytes, password_hash: bytes) -> bool:
+        """
+        Prüft Klartext gegen Hash, abhängig vom Hash-Format.
+
+        bcrypt ($2a$/$2b$/$2y$) ist Standard; argon2id ($argon2...) wird
+        unterstützt, wenn argon2-cffi installiert ist.
+
+        Raises:
+            PasswordHashingException: argon2-Hash ohne installiertes argon2-cffi
+        """
+        if not password_hash.startswith(b"$argon2"):
+            return bcrypt.checkpw(plain_bytes, password_hash)
+
+        if _ARGON2_HASHER is None:
+            raise PasswordHashingException("argon2-Hash erkannt, argon2-cffi ist nicht installiert")
+
+        try:
+            return _ARGON2_HASHER.verify(password_hash, plain_bytes)
+        except (VerificationError, InvalidHashError):
+            return False
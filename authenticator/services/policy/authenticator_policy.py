@@ -1,5 +1,6 @@
 """Policy für Authenticator-Geschäftsregeln."""
 from datetime import datetime
+from typing import Optional
 import re
 
 from ...dto.auth_dto import SessionDTO
@@ -15,8 +16,12 @@ class AuthenticatorPolicy:
     """Policy für Authenticator-Validierungen."""
 
     MIN_PASSWORD_LENGTH = 8
+    # Muss ganzes Passwort abdecken (fullmatch), nicht nur das erste Zeichen.
+    # Lookaheads mit negierten Klassen ([^a-z]*[a-z]) stoppen am ersten Treffer
+    # statt wie .* bis zum Ende zu laufen und zurückzuspringen.
     PASSWORD_PATTERN = re.compile(
-        r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]'
+        r'(?=[^a-z]*[a-z])(?=[^A-Z]*[A-Z])(?=\D*\d)(?=[^@$!%*?&]*[@$!%*?&])'
+        r'[A-Za-z\d@$!%*?&]+'
     )
 
     @staticmethod
@@ -53,30 +58,35 @@ class AuthenticatorPolicy:
                 f"Passwort muss mindestens {AuthenticatorPolicy.MIN_PASSWORD_LENGTH} Zeichen lang sein"
             )
 
-        if not AuthenticatorPolicy.PASSWORD_PATTERN.match(password):
+        if not AuthenticatorPolicy.PASSWORD_PATTERN.fullmatch(password):
             raise InvalidCredentialsException(
                 "Passwort muss mindestens einen Großbuchstaben, einen Kleinbuchstaben, "
-                "eine Zahl und ein Sonderzeichen enthalten"
+                "eine Zahl und ein Sonderzeichen (@$!%*?&) enthalten und darf nur "
+                "diese Zeichen verwenden"
             )
 
     @staticmethod
-    def validate_session(session: SessionDTO) -> None:
+    def validate_session(session: SessionDTO, now: Optional[datetime] = None) -> None:
         """
         Validiert eine Session.
 
         Args:
             session: Zu validierende Session
+            now: Referenzzeitpunkt (Default: datetime.now())
 
         Raises:
             SessionExpiredException: Wenn Session abgelaufen ist
             UserNotAuthenticatedException: Bei ungültiger Session
         """
-        if session.status == SessionStatus.EXPIRED:
+        # Enum-Member sind Singletons → Identitätsvergleich
+        if session.status is SessionStatus.EXPIRED:
             raise SessionExpiredException("Session ist abgelaufen")
 
-        if session.status == SessionStatus.INVALID:
+        if session.status is SessionStatus.INVALID:
             raise UserNotAuthenticatedException("Session ist ungültig")
 
         # Zeitbasierte Prüfung
-        if session.expires_at < datetime.now():
+        if now is None:
+            now = datetime.now()
+        if session.expires_at < now:
             raise SessionExpiredException("Session ist abgelaufen")
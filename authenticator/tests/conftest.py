@@ -1,24 +1,99 @@
 """Test Fixtures für Authenticator Tests."""
+import bcrypt
 import pytest
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from types import SimpleNamespace
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from shared.database.base import Base
 from ..repository.session_repository import SessionEntity
 from ..dto.auth_dto import LoginRequestDTO, SessionDTO
 from ..enum.auth_enum import SessionStatus
+from ..services import authenticator_service
 
+# Minimaler Cost-Faktor: Tests prüfen Logik, nicht die KDF-Härte
+_CHEAP_ROUNDS = 4
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """In-Memory Test-Datenbank, Schema wird einmal pro Test-Session erstellt."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # pysqlite verwaltet Transaktionen sonst selbst und bricht SAVEPOINTs;
+    # BEGIN daher explizit über SQLAlchemy steuern.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
-@pytest.fixture
-def db_session() -> Session:
-    """Erstellt eine In-Memory Test-Datenbank."""
-    engine = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(engine)
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine) -> Session:
+    """
+    Session in einer äußeren Transaktion, die nach jedem Test zurückgerollt wird.
+
+    commit()/rollback() im Code unter Test wirken nur auf SAVEPOINTs.
+    """
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def test_password_hash() -> bytes:
+    """bcrypt-Hash (cost 4) von "Test@1234", einmal pro Test-Session erzeugt."""
+    return bcrypt.hashpw(b"Test@1234", bcrypt.gensalt(rounds=_CHEAP_ROUNDS))
+
+
+@pytest.fixture(scope="session")
+def mock_user(test_password_hash) -> SimpleNamespace:
+    """
+    Test-Benutzer "testuser" (Passwort "Test@1234"), einmal pro Test-Session.
+
+    Wird von Tests nicht verändert; pro Test neu aufgebaut wird nur das
+    Repository-Mock, dessen Rückgabewerte Tests überschreiben.
+    """
+    return SimpleNamespace(
+        id=1,
+        username="testuser",
+        password_hash=test_password_hash.decode('utf-8'),
+        password_hash_bytes=test_password_hash
+    )
+
+
+@pytest.fixture(scope="session")
+def _cheap_dummy_hash() -> bytes:
+    """Günstiger Ersatz für den cost-12 Dummy-Hash des Services."""
+    return bcrypt.hashpw(b"unused", bcrypt.gensalt(rounds=_CHEAP_ROUNDS))
+
+
+@pytest.fixture(autouse=True)
+def _use_cheap_dummy_hash(monkeypatch, _cheap_dummy_hash):
+    """
+    Ersetzt den Dummy-Hash für unbekannte Benutzer durch einen cost-4-Hash.
+
+    Der Ablauf (ein echter bcrypt-Vergleich) bleibt erhalten, nur die
+    KDF-Kosten entfallen.
+    """
+    monkeypatch.setattr(authenticator_service, "_DUMMY_PASSWORD_HASH", _cheap_dummy_hash)
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 """Tests für AuthenticatorPolicy."""
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
 
 from ..services.policy.authenticator_policy import AuthenticatorPolicy
@@ -49,6 +50,22 @@ class TestAuthenticatorPolicy:
         with pytest.raises(InvalidCredentialsException):
             AuthenticatorPolicy.validate_password_strength("test@1234")
 
+    def test_validate_password_strength_requires_each_class(self):
+        """Test: Jede Zeichenklasse wird einzeln verlangt."""
+        # Act & Assert
+        for password in ("TEST@1234", "Test@abcd", "Test11234"):
+            with pytest.raises(InvalidCredentialsException):
+                AuthenticatorPolicy.validate_password_strength(password)
+
+    def test_validate_password_strength_checks_whole_password(self):
+        """Test: Unerlaubte Zeichen nach dem ersten Zeichen werden erkannt."""
+        # Act & Assert
+        with pytest.raises(InvalidCredentialsException):
+            AuthenticatorPolicy.validate_password_strength("Test@1234 ")
+
+        with pytest.raises(InvalidCredentialsException):
+            AuthenticatorPolicy.validate_password_strength("Test@1234#")
+
     def test_validate_session_active(self, sample_session_dto):
         """Test: Aktive Session validieren."""
         # Act & Assert
@@ -57,17 +74,27 @@ class TestAuthenticatorPolicy:
     def test_validate_session_expired(self, sample_session_dto):
         """Test: Abgelaufene Session."""
         # Arrange
-        sample_session_dto.status = SessionStatus.EXPIRED
+        session = replace(sample_session_dto, status=SessionStatus.EXPIRED)
 
         # Act & Assert
         with pytest.raises(SessionExpiredException):
-            AuthenticatorPolicy.validate_session(sample_session_dto)
+            AuthenticatorPolicy.validate_session(session)
 
     def test_validate_session_invalid(self, sample_session_dto):
         """Test: Ungültige Session."""
         # Arrange
-        sample_session_dto.status = SessionStatus.INVALID
+        session = replace(sample_session_dto, status=SessionStatus.INVALID)
 
         # Act & Assert
         with pytest.raises(UserNotAuthenticatedException):
-            AuthenticatorPolicy.validate_session(sample_session_dto)
+            AuthenticatorPolicy.validate_session(session)
+
+    def test_validate_session_uses_given_now(self, sample_session_dto):
+        """Test: Übergebener Zeitpunkt wird für die Ablaufprüfung genutzt."""
+        # Arrange
+        later = sample_session_dto.expires_at + timedelta(seconds=1)
+
+        # Act & Assert
+        AuthenticatorPolicy.validate_session(sample_session_dto, now=datetime.now())
+        with pytest.raises(SessionExpiredException):
+            AuthenticatorPolicy.validate_session(sample_session_dto, now=later)
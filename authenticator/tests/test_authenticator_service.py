@@ -1,28 +1,24 @@
 """Tests für AuthenticatorService."""
 import pytest
-from unittest.mock import Mock, MagicMock
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock, patch
 import bcrypt
+from sqlalchemy.exc import OperationalError
 
 from ..services.authenticator_service import AuthenticatorService
 from ..dto.auth_dto import LoginRequestDTO
-from ..exceptions import InvalidCredentialsException
+from ..exceptions import InvalidCredentialsException, PasswordHashingException, SessionNotFoundException
 
 
 class TestAuthenticatorService:
     """Tests für AuthenticatorService."""
 
     @pytest.fixture
-    def mock_user_repository(self):
+    def mock_user_repository(self, mock_user):
         """Mock für User Repository."""
         mock = Mock()
-        user = Mock()
-        user.id = 1
-        user.username = "testuser"
-        user.password_hash = bcrypt.hashpw(
-            "Test@1234".encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
-        mock.get_by_username.return_value = user
+        mock.get_by_username.return_value = mock_user
         return mock
 
     @pytest.fixture
@@ -41,19 +37,63 @@ class TestAuthenticatorService:
         assert result.session.username == "testuser"
         assert result.error_message is None
 
+    def test_login_user_without_hash_bytes(
+        self, service, mock_user, mock_user_repository, sample_login_request
+    ):
+        """Test: User-Objekte nur mit password_hash (str) funktionieren weiterhin."""
+        # Arrange
+        mock_user_repository.get_by_username.return_value = SimpleNamespace(
+            id=mock_user.id,
+            username=mock_user.username,
+            password_hash=mock_user.password_hash
+        )
+
+        # Act
+        result = service.login(sample_login_request)
+
+        # Assert
+        assert result.success is True
+
     def test_login_invalid_password(self, service, sample_login_request):
         """Test: Login mit falschem Passwort."""
         # Arrange
-        sample_login_request.password = "WrongPassword@123"
+        wrong_request = replace(sample_login_request, password="WrongPassword@123")
 
         # Act
-        result = service.login(sample_login_request)
+        result = service.login(wrong_request)
 
         # Assert
         assert result.success is False
         assert result.session is None
         assert result.error_message is not None
 
+    def test_login_unknown_user(self, service, mock_user_repository, sample_login_request):
+        """Test: Unbekannter Benutzer liefert dieselbe Antwort wie falsches Passwort."""
+        # Arrange
+        mock_user_repository.get_by_username.return_value = None
+
+        # Act
+        with patch("authenticator.services.authenticator_service.bcrypt.checkpw",
+                   wraps=bcrypt.checkpw) as checkpw:
+            result = service.login(sample_login_request)
+
+        # Assert
+        assert result.success is False
+        assert result.error_message == "Ungültige Anmeldedaten"
+        assert checkpw.call_count == 1
+
+    def test_login_empty_username_uses_generic_message(self, service, sample_login_request):
+        """Test: Validierungsfehler liefern die einheitliche Fehlerantwort."""
+        # Arrange
+        empty_request = replace(sample_login_request, username="")
+
+        # Act
+        result = service.login(empty_request)
+
+        # Assert
+        assert result.success is False
+        assert result.error_message == "Ungültige Anmeldedaten"
+
     def test_logout_success(self, service, sample_login_request):
         """Test: Erfolgreicher Logout."""
         # Arrange
@@ -83,3 +123,108 @@ class TestAuthenticatorService:
 
         # Assert
         assert session.username == "testuser"
+
+    def test_verify_password_caches_success(self, service, mock_user_repository):
+        """Test: Erfolgreiche Verifikation wird gecacht, bcrypt nur einmal."""
+        # Arrange
+        password_hash = mock_user_repository.get_by_username.return_value.password_hash
+
+        # Act
+        with patch("authenticator.services.authenticator_service.bcrypt.checkpw",
+                   wraps=bcrypt.checkpw) as checkpw:
+            assert service._verify_password("Test@1234", password_hash) is True
+            assert service._verify_password("Test@1234", password_hash) is True
+
+        # Assert
+        assert checkpw.call_count == 1
+
+    def test_verify_password_cache_expires(self, service, mock_user_repository):
+        """Test: Gemerkte Verifikation verfällt nach der TTL."""
+        # Arrange
+        password_hash = mock_user_repository.get_by_username.return_value.password_hash
+        service.VERIFY_CACHE_TTL_SECONDS = 0
+
+        # Act
+        with patch("authenticator.services.authenticator_service.bcrypt.checkpw",
+                   wraps=bcrypt.checkpw) as checkpw:
+            service._verify_password("Test@1234", password_hash)
+            service._verify_password("Test@1234", password_hash)
+
+        # Assert
+        assert checkpw.call_count == 2
+
+    def test_verify_password_does_not_cache_failure(self, service, mock_user_repository):
+        """Test: Fehlgeschlagene Verifikation wird nicht gecacht."""
+        # Arrange
+        password_hash = mock_user_repository.get_by_username.return_value.password_hash
+
+        # Act
+        with patch("authenticator.services.authenticator_service.bcrypt.checkpw",
+                   wraps=bcrypt.checkpw) as checkpw:
+            assert service._verify_password("Wrong@1234", password_hash) is False
+            assert service._verify_password("Wrong@1234", password_hash) is False
+
+        # Assert
+        assert checkpw.call_count == 2
+        assert len(service._verify_cache) == 0
+
+    def test_logout_evicts_cached_session(self, service, sample_login_request):
+        """Test: Nach Logout wird die Session nicht mehr aus dem Cache geliefert."""
+        # Arrange
+        session_id = service.login(sample_login_request).session.session_id
+        service.validate_session(session_id)
+
+        # Act
+        service.logout(session_id)
+
+        # Assert
+        with pytest.raises(SessionNotFoundException):
+            service.validate_session(session_id)
+
+    def test_login_triggers_expired_session_sweep(self, service, sample_login_request):
+        """Test: login() startet den Ablauf-Sweep nur nach Ablauf des Intervalls."""
+        # Arrange
+        repo = service._session_repository
+
+        # Act & Assert
+        with patch.object(repo, "delete_expired_sessions", return_value=0) as sweep:
+            service.login(sample_login_request)
+            sweep.assert_not_called()
+
+            service.EXPIRED_SESSION_SWEEP_INTERVAL = 0
+            service.login(sample_login_request)
+            sweep.assert_called_once_with(batch_size=1000)
+
+    def test_login_succeeds_when_sweep_fails(self, service, sample_login_request):
+        """Test: Ein Fehler im Ablauf-Sweep lässt den Login nicht scheitern."""
+        # Arrange
+        service.EXPIRED_SESSION_SWEEP_INTERVAL = 0
+
+        # Act
+        with patch.object(service._session_repository, "delete_expired_sessions",
+                          side_effect=OperationalError("DELETE", {}, Exception("database is locked"))):
+            result = service.login(sample_login_request)
+
+        # Assert
+        assert result.success is True
+        assert result.session is not None
+
+    def test_verify_password_argon2_hash(self, service):
+        """Test: argon2id-Hashes werden erkannt und geprüft."""
+        # Arrange
+        argon2 = pytest.importorskip("argon2")
+        password_hash = argon2.PasswordHasher().hash("Test@1234")
+
+        # Act & Assert
+        assert service._verify_password("Test@1234", password_hash) is True
+        assert service._verify_password("Wrong@1234", password_hash) is False
+
+    def test_verify_password_argon2_without_backend(self, service):
+        """Test: argon2-Hash ohne argon2-cffi führt zu PasswordHashingException."""
+        # Act & Assert
+        with patch("authenticator.services.authenticator_service._ARGON2_HASHER", None):
+            with pytest.raises(PasswordHashingException) as exc_info:
+                service._verify_password("Test@1234", "$argon2id$v=19$m=65536,t=3,p=4$abc$def")
+
+        # Nicht ein zweites Mal als "Fehler bei Passwort-Verifikation" verpackt
+        assert "Fehler bei Passwort-Verifikation" not in str(exc_info.value)
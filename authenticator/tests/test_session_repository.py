@@ -1,8 +1,15 @@
 """Tests für SessionRepository."""
 import pytest
+import time
 from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from ..repository.session_repository import SessionRepository, SessionEntity
+from ..repository import session_repository
+from ..repository.session_repository import SessionRepository, SessionEntity, _TokenPool
+from ..repository.session_cache import InMemorySessionCache, SessionCacheBackend
 from ..enum.auth_enum import SessionStatus
 from ..exceptions import SessionNotFoundException
 
@@ -32,6 +39,49 @@ class TestSessionRepository:
         assert session.ip_address == "127.0.0.1"
         assert len(session.session_id) > 0
 
+    def test_session_ids_unique_across_pool_refill(self):
+        """Test: Session-IDs bleiben über Nachfüllungen des Pools eindeutig."""
+        # Arrange
+        pool = _TokenPool()
+        count = _TokenPool.BATCH_SIZE * 2 + 1
+
+        # Act
+        tokens = {pool.next_token() for _ in range(count)}
+
+        # Assert
+        assert len(tokens) == count
+        assert all(len(token) == _TokenPool.TIME_PREFIX_CHARS + 43 for token in tokens)
+
+    def test_session_ids_time_ordered(self):
+        """Test: Später erzeugte IDs haben kein kleineres Zeitpräfix."""
+        # Arrange
+        pool = _TokenPool()
+        width = _TokenPool.TIME_PREFIX_CHARS
+
+        # Act
+        first = pool.next_token()
+        time.sleep(0.002)
+        second = pool.next_token()
+
+        # Assert
+        assert first[:width] < second[:width]
+        assert int(second[:width], 16) <= time.time_ns() // 1_000_000
+
+    def test_now_cached_reuses_recent_value(self, monkeypatch):
+        """Test: Wanduhr wird höchstens einmal pro Millisekunde gelesen."""
+        # Arrange
+        cached = datetime(2020, 1, 1)
+        monkeypatch.setattr(session_repository, "_WALL_CLOCK_CACHE", (time.monotonic() + 60, cached))
+
+        # Act & Assert: frischer Cache-Eintrag → gecachter Wert
+        assert session_repository._now_cached() is cached
+
+        # Arrange: veralteter Cache-Eintrag
+        monkeypatch.setattr(session_repository, "_WALL_CLOCK_CACHE", (time.monotonic() - 1, cached))
+
+        # Act & Assert: neu gelesen
+        assert session_repository._now_cached() > cached
+
     def test_get_session_success(self, db_session):
         """Test: Session erfolgreich laden."""
         # Arrange
@@ -46,6 +96,106 @@ class TestSessionRepository:
         assert loaded.user_id == created.user_id
         assert loaded.username == created.username
 
+    def test_get_session_served_from_cache(self, db_session):
+        """Test: Wiederholtes Laden trifft die Datenbank nicht erneut."""
+        # Arrange
+        repo = SessionRepository(db_session)
+        created = repo.create_session(user_id=1, username="testuser")
+
+        # Act
+        with patch.object(db_session, "execute") as execute:
+            loaded = repo.get_session(created.session_id)
+
+        # Assert
+        assert loaded == created
+        execute.assert_not_called()
+
+    def test_get_session_cache_entry_expires(self, db_session):
+        """Test: Nach Ablauf der TTL wird wieder aus der Datenbank gelesen."""
+        # Arrange
+        repo = SessionRepository(db_session, cache=InMemorySessionCache(ttl_seconds=0))
+        created = repo.create_session(user_id=1, username="testuser")
+
+        # Act
+        with patch.object(db_session, "execute", wraps=db_session.execute) as execute:
+            repo.get_session(created.session_id)
+
+        # Assert
+        execute.assert_called_once()
+
+    def test_delete_sessions_evict_cache(self, db_session):
+        """Test: delete_session/delete_user_sessions entfernen Cache-Einträge."""
+        # Arrange
+        cache = InMemorySessionCache()
+        repo = SessionRepository(db_session, cache=cache)
+        first = repo.create_session(user_id=1, username="testuser")
+        repo.create_session(user_id=1, username="testuser")
+        other = repo.create_session(user_id=2, username="otheruser")
+
+        # Act
+        repo.delete_session(first.session_id)
+        repo.delete_user_sessions(1)
+
+        # Assert
+        assert len(cache) == 1
+        assert cache.get(other.session_id) == other
+
+    def test_delete_session_invalidates_other_instances(self, db_session):
+        """Test: Logout über eine Instanz gilt sofort für alle Default-Repositories."""
+        # Arrange
+        repo_a = SessionRepository(db_session)
+        repo_b = SessionRepository(db_session)
+        created = repo_a.create_session(user_id=1, username="testuser")
+        repo_a.get_session(created.session_id)
+
+        # Act
+        repo_b.delete_session(created.session_id)
+
+        # Assert
+        with pytest.raises(SessionNotFoundException):
+            repo_a.get_session(created.session_id)
+
+    def test_default_cache_not_shared_across_engines(self):
+        """Test: Sessions einer Datenbank sind über den Default-Cache einer anderen nie sichtbar."""
+        # Arrange: zwei unabhängige In-Memory-Datenbanken
+        engines = [
+            create_engine("sqlite:///:memory:", poolclass=StaticPool) for _ in range(2)
+        ]
+        for engine in engines:
+            SessionEntity.__table__.create(engine)
+        session_a, session_b = (Session(bind=engine) for engine in engines)
+        try:
+            repo_a = SessionRepository(session_a)
+            repo_b = SessionRepository(session_b)
+            created = repo_a.create_session(user_id=1, username="testuser")
+
+            # Act & Assert
+            assert repo_a.get_session(created.session_id) == created
+            with pytest.raises(SessionNotFoundException):
+                repo_b.get_session(created.session_id)
+        finally:
+            session_a.close()
+            session_b.close()
+            for engine in engines:
+                engine.dispose()
+
+    def test_custom_cache_backend(self, db_session):
+        """Test: Ein eigenes SessionCacheBackend wird statt des Defaults genutzt."""
+        # Arrange
+        backend = Mock(spec=SessionCacheBackend)
+        backend.get.return_value = None
+        repo = SessionRepository(db_session, cache=backend)
+        created = repo.create_session(user_id=1, username="testuser")
+
+        # Act
+        repo.get_session(created.session_id)
+        repo.delete_session(created.session_id)
+
+        # Assert
+        backend.get.assert_called_once_with(created.session_id)
+        backend.set.assert_called_with(created)
+        backend.delete.assert_called_once_with(created.session_id)
+
     def test_get_session_not_found(self, db_session):
         """Test: Session nicht gefunden."""
         # Arrange
@@ -55,6 +205,29 @@ class TestSessionRepository:
         with pytest.raises(SessionNotFoundException):
             repo.get_session("nonexistent-session-id")
 
+    def test_get_user_sessions(self, db_session):
+        """Test: Alle Sessions eines Users laden, inkl. Status."""
+        # Arrange
+        repo = SessionRepository(db_session)
+        now = datetime.now()
+        db_session.add(SessionEntity(
+            session_id="expired-session",
+            user_id=1,
+            username="testuser",
+            created_at=now - timedelta(hours=25),
+            expires_at=now - timedelta(hours=1)
+        ))
+        db_session.commit()
+        active = repo.create_session(user_id=1, username="testuser")
+        repo.create_session(user_id=2, username="otheruser")
+
+        # Act
+        sessions = repo.get_user_sessions(1)
+
+        # Assert
+        assert [s.session_id for s in sessions] == [active.session_id, "expired-session"]
+        assert [s.status for s in sessions] == [SessionStatus.ACTIVE, SessionStatus.EXPIRED]
+
     def test_delete_session_success(self, db_session):
         """Test: Session erfolgreich löschen."""
         # Arrange
@@ -68,6 +241,18 @@ class TestSessionRepository:
         with pytest.raises(SessionNotFoundException):
             repo.get_session(session.session_id)
 
+    def test_delete_session_not_found(self, db_session):
+        """Test: Löschen einer unbekannten Session."""
+        # Arrange
+        repo = SessionRepository(db_session)
+        session = repo.create_session(user_id=1, username="testuser")
+
+        # Act & Assert
+        with pytest.raises(SessionNotFoundException):
+            repo.delete_session("nonexistent-session-id")
+
+        assert repo.get_session(session.session_id).session_id == session.session_id
+
     def test_delete_user_sessions(self, db_session):
         """Test: Alle Sessions eines Users löschen."""
         # Arrange
@@ -82,6 +267,52 @@ class TestSessionRepository:
 
         # Assert
         assert deleted_count == 2
+        assert repo.delete_user_sessions(user_id) == 0
+        assert repo.delete_user_sessions(2) == 1
+
+    def test_delete_expired_sessions(self, db_session):
+        """Test: Nur abgelaufene Sessions werden gelöscht, auch über mehrere Batches."""
+        # Arrange
+        repo = SessionRepository(db_session)
+        now = datetime.now()
+        for i in range(5):
+            db_session.add(SessionEntity(
+                session_id=f"expired-{i}",
+                user_id=1,
+                username="testuser",
+                created_at=now - timedelta(hours=25),
+                expires_at=now - timedelta(hours=1)
+            ))
+        db_session.commit()
+        active = repo.create_session(user_id=1, username="testuser")
+
+        # Act
+        deleted_count = repo.delete_expired_sessions(now=now, batch_size=2)
+
+        # Assert
+        assert deleted_count == 5
+        assert repo.get_session(active.session_id).session_id == active.session_id
+        assert repo.delete_expired_sessions(now=now) == 0
+
+    def test_session_indexes(self, db_session):
+        """Test: Indizes für user_id- und expires_at-Abfragen existieren."""
+        # Act
+        indexes = inspect(db_session.get_bind()).get_indexes("sessions")
+        columns_by_name = {idx["name"]: idx["column_names"] for idx in indexes}
+
+        # Assert
+        assert columns_by_name["ix_sessions_user_expires"] == ["user_id", "expires_at"]
+        assert columns_by_name["ix_sessions_expires_at"] == ["expires_at"]
+
+    def test_delete_user_sessions_uses_index(self, db_session):
+        """Test: DELETE pro Benutzer sucht über den user_id-Index statt Tabellenscan."""
+        # Act
+        plan = db_session.connection().exec_driver_sql(
+            "EXPLAIN QUERY PLAN DELETE FROM sessions WHERE user_id = 1"
+        ).all()
+
+        # Assert
+        assert any("ix_sessions_user_expires" in row[-1] for row in plan)
 
     def test_session_expiration(self, db_session):
         """Test: Abgelaufene Session wird erkannt."""
@@ -8,15 +8,21 @@ Version: 1.1.0
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_LOG_LEVELS_TEXT = str(sorted(_VALID_LOG_LEVELS))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AppConfigDTO:
     """
     Globale App-Konfiguration (Defaults + Override aus `config/app_config.json`).
 
+    Immutable; die Path-Objekte werden einmalig in __post_init__ erzeugt
+    und von den get_*-Methoden wiederverwendet.
+
     Struktur der config/app_config.json:
         {
             "app_name": "QMToolV6",
@@ -75,6 +81,18 @@ class AppConfigDTO:
     max_failed_logins: int = 5
     """Maximale Anzahl fehlgeschlagener Login-Versuche vor Account-Sperre."""
 
+    # ===== Abgeleitete Pfade (intern) =====
+    _db_path_obj: Path = field(init=False, repr=False, compare=False)
+    _data_dir_obj: Path = field(init=False, repr=False, compare=False)
+    _temp_dir_obj: Path = field(init=False, repr=False, compare=False)
+    _features_root_obj: Path = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_db_path_obj", Path(self.db_path))
+        object.__setattr__(self, "_data_dir_obj", Path(self.data_dir))
+        object.__setattr__(self, "_temp_dir_obj", Path(self.temp_dir))
+        object.__setattr__(self, "_features_root_obj", Path(self.features_root))
+
     def get_db_path(self) -> Path:
         """
         Gibt DB-Pfad als Path-Objekt zurück.
@@ -82,7 +100,7 @@ class AppConfigDTO:
         Returns:
             Path-Objekt zum Datenbank-File
         """
-        return Path(self.db_path)
+        return self._db_path_obj
 
     def get_data_dir(self) -> Path:
         """
@@ -91,7 +109,7 @@ class AppConfigDTO:
         Returns:
             Path-Objekt zum Daten-Verzeichnis
         """
-        return Path(self.data_dir)
+        return self._data_dir_obj
 
     def get_temp_dir(self) -> Path:
         """
@@ -100,7 +118,7 @@ class AppConfigDTO:
         Returns:
             Path-Objekt zum Temp-Verzeichnis
         """
-        return Path(self.temp_dir)
+        return self._temp_dir_obj
 
     def get_features_root(self) -> Path:
         """
@@ -109,7 +127,7 @@ class AppConfigDTO:
         Returns:
             Path-Objekt zum Features-Root-Verzeichnis
         """
-        return Path(self.features_root)
+        return self._features_root_obj
 
     def validate(self) -> None:
         """
@@ -137,9 +155,8 @@ class AppConfigDTO:
                 f"default_retention_days must be > 0, got {self.default_retention_days}"
             )
 
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.default_log_level not in valid_levels:
+        if self.default_log_level not in _VALID_LOG_LEVELS:
             raise ValueError(
-                f"default_log_level must be one of {valid_levels}, "
+                f"default_log_level must be one of {_VALID_LOG_LEVELS_TEXT}, "
                 f"got '{self.default_log_level}'"
             )
\ No newline at end of file
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditConfigDTO:
     """Audit-spezifische Feature-Konfiguration (aus meta.json)."""
 
     must_audit: bool = False
     min_log_level: str = "INFO"
-    critical_actions: Optional[List[str]] = None
+    critical_actions: Optional[Tuple[str, ...]] = None
     retention_days: int = 365
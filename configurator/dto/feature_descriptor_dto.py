@@ -8,13 +8,16 @@ Version: 1.0.0
 """
 from __future__ import annotations
 
+import sys
+import threading
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import ClassVar, FrozenSet, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from configurator.dto.audit_config_dto import AuditConfigDTO
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class FeatureDescriptorDTO:
     """
     Feature-Beschreibung aus `<feature_id>/meta.json`.
@@ -26,11 +29,11 @@ class FeatureDescriptorDTO:
     - main_class: Vollqualifizierter Python-Pfad zur Service-Klasse
 
     Optionale Felder:
-    - visible_for: Rollen-basierte Sichtbarkeit (None = alle)
+    - visible_for: Rollen-basierte Sichtbarkeit (leer = alle, Tuple)
     - is_core: Markiert Core-Features (nicht deaktivierbar)
     - sort_order: Sortierung in UI (niedriger = weiter oben)
     - requires_login: Ob Login erforderlich ist
-    - dependencies: Liste anderer Feature-IDs, die benötigt werden
+    - dependencies: Andere Feature-IDs, die benötigt werden (Tuple)
     - audit:  Audit-Konfiguration
     - description:  Beschreibungstext
     - icon: Icon-Name oder Pfad
@@ -71,7 +74,7 @@ class FeatureDescriptorDTO:
     """Vollqualifizierter Python-Pfad zur Service-Klasse."""
 
     # ===== Optionale Felder =====
-    visible_for: List[str] = field(default_factory=list)
+    visible_for: Tuple[str, ...] = ()
     """Rollen, die dieses Feature sehen dürfen (leer = alle)."""
 
     is_core: bool = False
@@ -83,8 +86,8 @@ class FeatureDescriptorDTO:
     requires_login: bool = True
     """Ob Login erforderlich ist, um Feature zu nutzen."""
 
-    dependencies: List[str] = field(default_factory=list)
-    """Liste von Feature-IDs, die vorab geladen sein müssen."""
+    dependencies: Tuple[str, ...] = ()
+    """Feature-IDs, die vorab geladen sein müssen (Reihenfolge wie in meta.json)."""
 
     audit: Optional[AuditConfigDTO] = None
     """Audit-spezifische Konfiguration."""
@@ -95,6 +98,43 @@ class FeatureDescriptorDTO:
     icon: Optional[str] = None
     """Icon-Name oder Pfad."""
 
+    # ===== Interning (Klassen-Attribut, kein Feld) =====
+    _interned: ClassVar[WeakValueDictionary[str, FeatureDescriptorDTO]] = WeakValueDictionary()
+    _intern_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # ===== Lookup-Sets (intern, aus visible_for/dependencies abgeleitet) =====
+    _visible_for_upper: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _dependency_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_visible_for_upper", frozenset(sys.intern(r.upper()) for r in self.visible_for)
+        )
+        object.__setattr__(self, "_dependency_set", frozenset(self.dependencies))
+
+    @classmethod
+    def intern(cls, descriptor: FeatureDescriptorDTO) -> FeatureDescriptorDTO:
+        """
+        Liefert die geteilte Instanz für einen gleichen Descriptor.
+
+        Gleiche Descriptors (gleiche ID und gleicher Inhalt) teilen sich so
+        ein Objekt. Weicht der Inhalt ab (z.B. geänderte meta.json), ersetzt
+        der neue Descriptor den alten. Nicht mehr referenzierte Instanzen
+        fallen automatisch aus der Tabelle (WeakValueDictionary).
+
+        Args:
+            descriptor: Frisch geparster Descriptor
+
+        Returns:
+            Geteilte Instanz (ggf. descriptor selbst)
+        """
+        with cls._intern_lock:
+            existing = cls._interned.get(descriptor.id)
+            if existing is not None and existing == descriptor:
+                return existing
+            cls._interned[descriptor.id] = descriptor
+            return descriptor
+
     def is_visible_for_role(self, role: str) -> bool:
         """
         Prüft, ob Feature für gegebene Rolle sichtbar ist.
@@ -105,9 +145,9 @@ class FeatureDescriptorDTO:
         Returns:
             True wenn sichtbar (visible_for ist leer oder role enthalten)
         """
-        if not self.visible_for:
+        if not self._visible_for_upper:
             return True
-        return role.upper() in [r.upper() for r in self.visible_for]
+        return role.upper() in self._visible_for_upper
 
     def has_dependency(self, feature_id: str) -> bool:
         """
@@ -119,4 +159,4 @@ class FeatureDescriptorDTO:
         Returns:
             True wenn Abhängigkeit besteht
         """
-        return feature_id in self.dependencies
\ No newline at end of file
+        return feature_id in self._dependency_set
@@ -8,14 +8,14 @@ Version: 1.0.0
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from configurator.dto.feature_descriptor_dto import FeatureDescriptorDTO
 from configurator.enum.feature_status import FeatureStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureRegistryDTO:
     """
     Registry-Eintrag für ein Feature (Descriptor + Status).
@@ -42,6 +42,14 @@ class FeatureRegistryDTO:
     error: Optional[str] = None
     """Fehlermeldung falls status=ERROR (MVP: immer None)."""
 
+    _available: bool = field(init=False, repr=False, compare=False)
+    """Vorberechnetes Ergebnis von is_available() (DTO ist immutable)."""
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "_available", self.status is FeatureStatus.ACTIVE and self.error is None
+        )
+
     def is_available(self) -> bool:
         """
         Prüft, ob Feature verfügbar ist.
@@ -49,7 +57,7 @@ class FeatureRegistryDTO:
         Returns:
             True wenn status=ACTIVE und kein Error
         """
-        return self.status == FeatureStatus.ACTIVE and self.error is None
+        return self._available
 
     def get_feature_id(self) -> str:
         """
@@ -8,13 +8,14 @@ Version: 1.1.0
 """
 from __future__ import annotations
 
-import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict
 
 from configurator.dto.app_config_dto import AppConfigDTO
 from configurator.exceptions.config_validation_exception import ConfigValidationException
+from configurator.repository.json_loader import JSONDecodeError, load_json_file
 
 logger = logging. getLogger(__name__)
 
@@ -44,8 +45,9 @@ class ConfigRepository:
         Args:
             project_root: Root-Verzeichnis des Projekts
         """
-        self._project_root = Path(project_root).resolve()
-        logger.info(f"ConfigRepository initialized with root: {self._project_root}")
+        # abspath statt resolve(): rein textuell, keine Syscalls je Pfadkomponente
+        self._project_root = Path(os.path.abspath(project_root))
+        logger.info("ConfigRepository initialized with root: %s", self._project_root)
 
     def load_app_config(self, strict: bool = False) -> AppConfigDTO:
         """
@@ -88,15 +90,9 @@ class ConfigRepository:
         # Defaults
         dto = AppConfigDTO()
 
-        # Datei nicht vorhanden → Defaults verwenden
-        if not config_path.exists():
-            logger.info("No app_config.json found, using defaults")
-            return dto
-
-        # JSON laden
+        # JSON laden (fehlende Datei → Defaults, ohne vorgelagerten exists()-stat)
         try:
-            raw_text = config_path.read_text(encoding="utf-8")
-            raw = json.loads(raw_text)
+            raw = load_json_file(config_path)
 
             if not isinstance(raw, dict):
                 error_msg = "app_config.json root must be a JSON object"
@@ -106,12 +102,16 @@ class ConfigRepository:
                         type(raw).__name__,
                         error_msg
                     )
-                logger.warning(f"{error_msg}, using defaults")
+                logger.warning("%s, using defaults", error_msg)
                 return dto
 
-            logger.info(f"Loaded app_config.json from {config_path}")
+            logger.info("Loaded app_config.json from %s", config_path)
+
+        except FileNotFoundError:
+            logger.info("No app_config.json found, using defaults")
+            return dto
 
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             error_msg = f"Invalid JSON in app_config.json: {e}"
             if strict:
                 raise ConfigValidationException(
@@ -119,7 +119,7 @@ class ConfigRepository:
                     None,
                     f"JSON parsing failed: {e}"
                 ) from e
-            logger.error(f"{error_msg}, using defaults")
+            logger.error("%s, using defaults", error_msg)
             return dto
 
         except Exception as e:
@@ -130,7 +130,7 @@ class ConfigRepository:
                     None,
                     f"File read error: {e}"
                 ) from e
-            logger.error(f"{error_msg}, using defaults")
+            logger.error("%s, using defaults", error_msg)
             return dto
 
         # Sections extrahieren
@@ -190,7 +190,7 @@ class ConfigRepository:
                     None,
                     str(e)
                 ) from e
-            logger.error(f"{error_msg}, using defaults")
+            logger.error("%s, using defaults", error_msg)
             return AppConfigDTO()
 
     def _get_string(
@@ -244,8 +244,8 @@ class ConfigRepository:
             # Min-Value Check
             if min_value is not None and int_value < min_value:
                 logger.warning(
-                    f"Value for {key} ({int_value}) is below minimum ({min_value}), "
-                    f"using default {default}"
+                    "Value for %s (%s) is below minimum (%s), using default %s",
+                    key, int_value, min_value, default
                 )
                 return default
 
@@ -253,6 +253,6 @@ class ConfigRepository:
 
         except (ValueError, TypeError):
             logger.warning(
-                f"Invalid int value for {key}: {value}, using default {default}"
+                "Invalid int value for %s: %s, using default %s", key, value, default
             )
             return default
\ No newline at end of file
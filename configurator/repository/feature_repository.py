@@ -6,19 +6,52 @@ Scannt Level-1 Ordner nach meta.json, cached Descriptors und validiert Konventio
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
-import re
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from configurator.dto.audit_config_dto import AuditConfigDTO
 from configurator.dto.feature_descriptor_dto import FeatureDescriptorDTO
 from configurator.exceptions.feature_not_found_exception import FeatureNotFoundException
 from configurator.exceptions.invalid_meta_exception import InvalidMetaException
+from configurator.repository.json_loader import JSONDecodeError, load_json_bytes
+
+try:  # optional: watchdog (Dateisystem-Events statt reiner mtime-Prüfung)
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
 
 logger = logging.getLogger(__name__)
 
+# (Quelle, Rolle (upper) → sichtbare Features, öffentliche Features)
+_RoleIndex = Tuple[
+    Tuple[FeatureDescriptorDTO, ...],
+    Dict[str, Tuple[FeatureDescriptorDTO, ...]],
+    Tuple[FeatureDescriptorDTO, ...],
+]
+
+
+if Observer is not None:
+    class _MetaJsonChangeHandler(FileSystemEventHandler):
+        """Leitet Dateisystem-Events an FeatureRepository._on_fs_event weiter."""
+
+        def __init__(self, repository: FeatureRepository):
+            super().__init__()
+            self._repository = repository
+
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path:
+                    self._repository._on_fs_event(os.fsdecode(path), event.is_directory)
+
 
 class FeatureRepository:
     """
@@ -27,13 +60,17 @@ class FeatureRepository:
     Erzwingt Konvention: id == Ordnername (case-sensitive).
     """
 
-    IGNORE_FOLDERS = {
+    # Wird vor jedem Dateisystemzugriff geprüft (reiner Hash-Lookup)
+    IGNORE_FOLDERS = frozenset({
         "shared",
         ".idea",
         ".venv",
         "venv",
         "__pycache__",
         ".pytest_cache",
+        ".mypy_cache",
+        ".tox",
+        "node_modules",
         "tests",
         ".git",
         "docs",
@@ -41,103 +78,460 @@ class FeatureRepository:
         "config",
         "data",
         "temp",
-    }
-
-    VERSION_PATTERN = re.compile(r"^\d+\.\d+\.\d+$")
-    VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-
-    def __init__(self, features_root: str = ".", strict_mode: bool = True):
+    })
+
+    VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+    # Einmal formatiert für die Fehlermeldung (statt sorted() pro Fehler)
+    VALID_LOG_LEVELS_TEXT = str(sorted(VALID_LOG_LEVELS))
+    REQUIRED_FIELDS = ("id", "label", "version", "main_class")
+    # Optionale Felder: (Feld, erwarteter Typ, Fehlermeldung)
+    TYPE_CHECKS = (
+        ("visible_for", list, "visible_for must be a list"),
+        ("dependencies", list, "dependencies must be a list"),
+        ("is_core", bool, "is_core must be a boolean"),
+        ("requires_login", bool, "requires_login must be a boolean"),
+    )
+    # Listenfelder, deren Einträge Strings sein müssen (der DTO bildet daraus
+    # frozensets bzw. ruft upper() auf)
+    STRING_LIST_FIELDS = ("visible_for", "dependencies")
+
+    # meta.json-Dateien, die jünger sind als dieses Fenster, gelten als "racy":
+    # eine erneute Änderung im selben Zeitstempel-Tick wäre an mtime/size nicht
+    # erkennbar, daher wird ein solcher Scan nicht gemerkt (vgl. "racy git").
+    MTIME_RACY_WINDOW_NS = 2_000_000_000
+
+    # Prozessweiter LRU-Cache geparster meta.json (über Repository-Instanzen
+    # hinweg), Key: (Pfad, Ordnername, mtime_ns, size). "Racy" Dateien (siehe
+    # MTIME_RACY_WINDOW_NS) werden nicht aufgenommen.
+    PARSE_CACHE_SIZE = 1024
+    _parse_cache: ClassVar[OrderedDict[Tuple[str, str, int, int], FeatureDescriptorDTO]] = OrderedDict()
+    _parse_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    # Max. Anzahl gemerkter unbekannter IDs in get_by_id()
+    MISSING_CACHE_SIZE = 256
+
+    # Ab so vielen meta.json-Dateien wird parallel gelesen/geparst
+    # (Lesen gibt den GIL frei); darunter überwiegt der Thread-Overhead.
+    PARALLEL_LOAD_THRESHOLD = 8
+    MAX_LOAD_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+    def __init__(self, features_root: str = ".", strict_mode: bool = True, watch: bool = False):
         """
         Args:
             features_root: Root-Verzeichnis für Feature-Discovery.
             strict_mode:
                 True  -> discover_all() wirft InvalidMetaException sofort (Test-Erwartung)
                 False -> ungültige Features werden geloggt und übersprungen
+            watch: Caches bei Änderungen an Feature-Ordnern/meta.json sofort
+                   verwerfen (benötigt watchdog; sonst nur mtime-Prüfung in
+                   discover_all()). Mit close() beenden.
         """
-        self._features_root = Path(features_root).resolve()
+        # abspath normalisiert rein textuell (kein readlink je Vorfahr wie
+        # resolve()); Symlinks im Pfad bleiben erhalten
+        self._features_root_str = os.path.abspath(features_root)
+        self._features_root = Path(self._features_root_str)
         self._cache: Dict[str, FeatureDescriptorDTO] = {}
+        # IDs, für die get_by_id() keine meta.json gefunden hat (Negativ-Cache,
+        # LRU-begrenzt auf MISSING_CACHE_SIZE gegen beliebig viele Fehl-IDs)
+        self._missing: OrderedDict[str, None] = OrderedDict()
+        # Letzter Inhalts-Hash je meta.json-Pfad → Descriptor; greift, wenn
+        # mtime/size sich geändert haben (oder "racy" sind), der Inhalt aber nicht
+        self._hash_cache: Dict[str, Tuple[bytes, FeatureDescriptorDTO]] = {}
+        # Ergebnis des letzten discover_all() + Signatur (Name, mtime_ns, size je meta.json)
+        self._discover_signature: Optional[Tuple[Tuple[str, int, int], ...]] = None
+        self._discover_result: Tuple[FeatureDescriptorDTO, ...] = ()
+        # Rollen-Index als ein Tuple (Quelle, Rolle (upper) → sichtbare Features,
+        # öffentliche Features), Quelle = _discover_result zum Bauzeitpunkt;
+        # Features ohne visible_for stehen in jeder Liste und in den
+        # öffentlichen Features (für unbekannte Rollen). Als Ganzes ersetzt,
+        # damit Index und Quelle nie auseinanderlaufen.
+        self._role_index: Optional[_RoleIndex] = None
         self._strict_mode = strict_mode
+
+        self._observer = None
+        self._handler = None
+        self._watched_dirs: Set[str] = set()
+        # Schützt _cache, _missing, _discover_signature/_discover_result,
+        # _role_index und _watched_dirs gegen den watchdog-Thread
+        # (_on_fs_event). Nie halten, während observer.schedule() läuft: der
+        # Observer ruft den Handler unter seinem eigenen Lock auf (sonst Deadlock).
+        self._lock = threading.Lock()
+        if watch:
+            self._start_watching()
+
         logger.info("FeatureRepository initialized with root: %s", self._features_root)
 
     def discover_all(self) -> List[FeatureDescriptorDTO]:
         """
         Scannt features_root nach Level-1 Features.
 
+        Haben sich die meta.json-Dateien seit dem letzten Aufruf nicht geändert
+        (gleiche Ordner, mtime und Größe), wird das vorherige Ergebnis ohne
+        erneutes Lesen/Parsen geliefert.
+
         Raises:
             InvalidMetaException: Standardmäßig (strict_mode=True) bei ungültiger meta.json.
         """
-        if not self._features_root.exists() or not self._features_root.is_dir():
+        scan_started_ns = time.time_ns()
+        # Kein exists()/is_dir() vorab: scandir meldet fehlende Roots selbst
+        try:
+            candidates = self._scan_meta_files()
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning("Features root does not exist: %s", self._features_root)
             return []
+        except PermissionError as e:
+            logger.warning("Features root not readable: %s (%s)", self._features_root, e)
+            return []
+        signature = tuple(
+            (name, stat.st_mtime_ns, stat.st_size) for name, _, stat in candidates
+        )
+        if signature == self._discover_signature:
+            return list(self._discover_result)
 
         descriptors: List[FeatureDescriptorDTO] = []
+        folder_names: List[str] = []
 
-        for child in sorted(self._features_root.iterdir()):
-            if not child.is_dir() or child.name in self.IGNORE_FOLDERS:
+        for (folder_name, _, _), result in zip(candidates, self._load_candidates(candidates)):
+            if isinstance(result, InvalidMetaException):
+                logger.error("Invalid meta.json in %s: %s", folder_name, result.reason)
+                if self._strict_mode:
+                    raise result
                 continue
 
-            meta_path = child / "meta.json"
-            if not meta_path.exists():
+            folder_names.append(folder_name)
+            descriptors.append(result)
+
+        racy_after_ns = scan_started_ns - self.MTIME_RACY_WINDOW_NS
+        with self._lock:
+            for descriptor in descriptors:
+                self._cache[descriptor.id] = descriptor
+                self._missing.pop(descriptor.id, None)
+            if all(mtime_ns < racy_after_ns for _, mtime_ns, _ in signature):
+                self._discover_signature = signature
+                self._discover_result = tuple(descriptors)
+            else:
+                self._discover_signature = None
+
+        for folder_name in folder_names:
+            self._watch_feature_dir(folder_name)
+        return descriptors
+
+    def get_by_role(self, role: str) -> List[FeatureDescriptorDTO]:
+        """
+        Liefert die für eine Rolle sichtbaren Features (Discovery-Reihenfolge).
+
+        discover_all() prüft zuerst die Signatur der meta.json (neue,
+        gelöschte oder geänderte Features werden so erkannt); für ein
+        gemerktes Ergebnis wird einmalig ein Rollen-Index gebaut, statt pro
+        Aufruf alle Descriptors zu filtern.
+
+        Args:
+            role: Rollenname (Groß-/Kleinschreibung egal)
+
+        Raises:
+            InvalidMetaException: Wie discover_all(), falls neu gescannt wird.
+        """
+        role_upper = role.upper()
+        descriptors = self.discover_all()
+        # Snapshot unter dem Lock: der watchdog-Thread kann die Felder jederzeit
+        # zurücksetzen, der Index wird nur aus genau diesem Ergebnis gebaut
+        with self._lock:
+            signature = self._discover_signature
+            result = self._discover_result
+            role_index = self._role_index
+        if signature is None:
+            # Ergebnis nicht gemerkt ("racy" Dateien) → kein Index
+            return [d for d in descriptors if d.is_visible_for_role(role_upper)]
+
+        if role_index is None or role_index[0] is not result:
+            role_index = self._build_role_index(result)
+            with self._lock:
+                self._role_index = role_index
+        _, index, public = role_index
+        return list(index.get(role_upper, public))
+
+    @staticmethod
+    def _build_role_index(descriptors: Tuple[FeatureDescriptorDTO, ...]) -> _RoleIndex:
+        """Baut den Rollen-Index aus einem gemerkten discover_all()-Ergebnis."""
+        roles = {sys.intern(role.upper()) for d in descriptors for role in d.visible_for}
+        index: Dict[str, List[FeatureDescriptorDTO]] = {role: [] for role in roles}
+        public: List[FeatureDescriptorDTO] = []
+
+        for descriptor in descriptors:
+            if not descriptor.visible_for:
+                public.append(descriptor)
+                for role_list in index.values():
+                    role_list.append(descriptor)
                 continue
+            # set: doppelte Einträge in visible_for nur einmal einsortieren
+            for role in {role.upper() for role in descriptor.visible_for}:
+                index[role].append(descriptor)
+
+        return (
+            descriptors,
+            {role: tuple(role_list) for role, role_list in index.items()},
+            tuple(public),
+        )
+
+    def invalidate(self, feature_id: Optional[str] = None) -> None:
+        """
+        Verwirft gecachte Descriptors und Negativ-Einträge.
+
+        Args:
+            feature_id: Nur dieses Feature verwerfen (None = alles, inkl.
+                        gemerktem discover_all()-Ergebnis)
+        """
+        with self._lock:
+            self._discover_signature = None
+            if feature_id is None:
+                self._cache.clear()
+                self._missing.clear()
+                self._discover_result = ()
+                return
+
+            self._cache.pop(feature_id, None)
+            self._missing.pop(feature_id, None)
+
+    def close(self) -> None:
+        """Beendet die Dateisystem-Überwachung (falls aktiv)."""
+        if self._observer is None:
+            return
+        self._observer.stop()
+        self._observer.join()
+        self._observer = None
+        with self._lock:
+            self._watched_dirs.clear()
+
+    def _start_watching(self) -> None:
+        """Startet die Überwachung von features_root (Level 1, nicht rekursiv)."""
+        if Observer is None:
+            logger.warning("watchdog not installed, falling back to mtime checks in discover_all()")
+            return
+        if not self._features_root.is_dir():
+            logger.warning("Features root does not exist, not watching: %s", self._features_root)
+            return
+
+        self._handler = _MetaJsonChangeHandler(self)
+        self._observer = Observer()
+        self._observer.daemon = True
+        # Nicht rekursiv: features_root ist oft das Projekt-Root (.git, .venv, ...);
+        # Feature-Ordner werden einzeln angemeldet, sobald sie bekannt sind.
+        self._observer.schedule(self._handler, self._features_root_str, recursive=False)
+        self._observer.start()
+
+    def _watch_feature_dir(self, folder_name: str) -> None:
+        """Meldet einen Feature-Ordner zur Überwachung an (einmalig)."""
+        observer = self._observer
+        if observer is None:
+            return
+        with self._lock:
+            if folder_name in self._watched_dirs:
+                return
+            self._watched_dirs.add(folder_name)
+        try:
+            observer.schedule(
+                self._handler,
+                os.path.join(self._features_root_str, folder_name),
+                recursive=False
+            )
+        except OSError as e:
+            with self._lock:
+                self._watched_dirs.discard(folder_name)
+            logger.warning("Cannot watch feature folder %s: %s", folder_name, e)
+
+    def _on_fs_event(self, path: str, is_directory: bool) -> None:
+        """
+        Verwirft Caches für das betroffene Feature.
 
+        Relevant sind Ordner auf Level 1 (neu/gelöscht/umbenannt) und
+        `<feature_id>/meta.json`; alles andere wird ignoriert.
+        """
+        parts = os.path.relpath(path, self._features_root_str).split(os.sep)
+        folder_name = parts[0]
+        if folder_name in (os.curdir, os.pardir) or folder_name in self.IGNORE_FOLDERS:
+            return
+
+        if len(parts) == 1 and is_directory:
+            self.invalidate(folder_name)
+            if os.path.isdir(path):
+                self._watch_feature_dir(folder_name)
+            else:
+                with self._lock:
+                    self._watched_dirs.discard(folder_name)
+        elif parts[1:] == ["meta.json"]:
+            self.invalidate(folder_name)
+
+    def _load_candidates(
+        self,
+        candidates: List[Tuple[str, str, os.stat_result]]
+    ) -> Iterator[Union[FeatureDescriptorDTO, InvalidMetaException]]:
+        """
+        Lädt die meta.json-Dateien der Kandidaten in deren Reihenfolge.
+
+        Ab PARALLEL_LOAD_THRESHOLD Kandidaten über einen ThreadPoolExecutor.
+        Validierungsfehler werden als Wert geliefert, damit der Aufrufer sie
+        in Ordner-Reihenfolge (wie beim seriellen Scan) behandeln kann.
+        """
+        def load(candidate: Tuple[str, str, os.stat_result]):
+            folder_name, meta_path, stat = candidate
             try:
-                descriptor = self._load_and_validate(meta_path=meta_path, folder_name=child.name)
-                self._cache[descriptor.id] = descriptor
-                descriptors.append(descriptor)
+                return self._load_and_validate(meta_path=meta_path, folder_name=folder_name, stat=stat)
             except InvalidMetaException as e:
-                logger.error("Invalid meta.json in %s: %s", child.name, e.reason)
-                if self._strict_mode:
-                    raise
+                return e
 
-        return descriptors
+        if len(candidates) < self.PARALLEL_LOAD_THRESHOLD:
+            yield from map(load, candidates)
+            return
 
-    def get_by_id(self, feature_id: str) -> FeatureDescriptorDTO:
+        workers = min(self.MAX_LOAD_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="meta-json") as executor:
+            yield from executor.map(load, candidates)
+
+    def _scan_meta_files(self) -> List[Tuple[str, str, os.stat_result]]:
         """
-        Lädt den Feature-Descriptor nach ID.
+        Listet Level-1 Feature-Ordner mit meta.json (sortiert nach Name).
+
+        Returns:
+            Liste von (Ordnername, Pfad zur meta.json, stat der meta.json)
         """
-        if feature_id in self._cache:
-            return self._cache[feature_id]
+        candidates: List[Tuple[str, str, os.stat_result]] = []
 
-        meta_path = self._features_root / feature_id / "meta.json"
-        if not meta_path.exists():
-            raise FeatureNotFoundException(feature_id)
+        # scandir: Dateityp kommt aus dem Verzeichniseintrag, kein stat() pro Ordner
+        with os.scandir(self._features_root) as it:
+            for entry in it:
+                if entry.name in self.IGNORE_FOLDERS or not entry.is_dir():
+                    continue
 
-        descriptor = self._load_and_validate(meta_path=meta_path, folder_name=feature_id)
-        self._cache[descriptor.id] = descriptor
+                meta_path = os.path.join(entry.path, "meta.json")
+                try:
+                    stat = os.stat(meta_path)
+                except OSError:
+                    continue
+
+                candidates.append((entry.name, meta_path, stat))
+
+        # Erst nach dem Filtern sortieren: nur echte Feature-Ordner. Die feste
+        # Reihenfolge hält Signatur und Fehlerreihenfolge deterministisch.
+        candidates.sort(key=lambda candidate: candidate[0])
+        return candidates
+
+    def get_by_id(self, feature_id: str) -> FeatureDescriptorDTO:
+        """
+        Lädt den Feature-Descriptor nach ID.
+
+        Fehlende Features werden gemerkt und ohne erneuten Dateizugriff
+        abgelehnt, bis invalidate() oder discover_all() sie wieder findet.
+        """
+        # get() statt "in" + []: der watchdog-Thread kann dazwischen invalidieren
+        descriptor = self._cache.get(feature_id)
+        if descriptor is not None:
+            return descriptor
+        with self._lock:
+            if feature_id in self._missing:
+                # Treffer ans Ende: verdrängt wird die am längsten nicht erfragte ID
+                self._missing.move_to_end(feature_id)
+                raise FeatureNotFoundException(feature_id)
+
+        meta_path = os.path.join(self._features_root_str, feature_id, "meta.json")
+        try:
+            descriptor = self._load_and_validate(meta_path=meta_path, folder_name=feature_id)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            with self._lock:
+                self._missing[feature_id] = None
+                if len(self._missing) > self.MISSING_CACHE_SIZE:
+                    self._missing.popitem(last=False)
+            raise FeatureNotFoundException(feature_id) from e
+        with self._lock:
+            self._cache[descriptor.id] = descriptor
+        self._watch_feature_dir(feature_id)
         return descriptor
 
     def validate(self, feature_id: str) -> bool:
         _ = self.get_by_id(feature_id)
         return True
 
-    def _load_and_validate(self, meta_path: Path, folder_name: str) -> FeatureDescriptorDTO:
+    def _load_and_validate(
+        self,
+        meta_path: str,
+        folder_name: str,
+        stat: Optional[os.stat_result] = None
+    ) -> FeatureDescriptorDTO:
+        """
+        Liefert den Descriptor zu einer meta.json, bevorzugt aus dem Parse-Cache.
+
+        Args:
+            meta_path: Pfad zur meta.json
+            folder_name: Name des Feature-Ordners
+            stat: Bereits ermitteltes os.stat der Datei (spart einen Syscall)
+
+        Raises:
+            InvalidMetaException: Bei ungültiger meta.json
+            FileNotFoundError: Wenn meta.json nicht existiert
+        """
+        if stat is None:
+            stat = os.stat(meta_path)
+        key = (meta_path, folder_name, stat.st_mtime_ns, stat.st_size)
+
+        cache = self._parse_cache
+        with self._parse_cache_lock:
+            descriptor = cache.get(key)
+            if descriptor is not None:
+                cache.move_to_end(key)
+                return descriptor
+
+        descriptor = self._parse_meta_file(meta_path=meta_path, folder_name=folder_name)
+
+        if stat.st_mtime_ns < time.time_ns() - self.MTIME_RACY_WINDOW_NS:
+            with self._parse_cache_lock:
+                cache[key] = descriptor
+                if len(cache) > self.PARSE_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+        return descriptor
+
+    def _parse_meta_file(self, meta_path: str, folder_name: str) -> FeatureDescriptorDTO:
+        with open(meta_path, "rb") as f:
+            raw_bytes = f.read()
+
+        # blake2b ist deutlich schneller als Parsen + Validieren derselben bytes
+        digest = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+        cached = self._hash_cache.get(meta_path)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+
+        descriptor = self._build_descriptor(raw_bytes, folder_name)
+        self._hash_cache[meta_path] = (digest, descriptor)
+        return descriptor
+
+    def _build_descriptor(self, raw_bytes: bytes, folder_name: str) -> FeatureDescriptorDTO:
         try:
-            raw = json.loads(meta_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as e:
+            raw = load_json_bytes(raw_bytes)
+        except JSONDecodeError as e:
             # Test erwartet Substring "JSON-Parsing fehlgeschlagen"
             raise InvalidMetaException(folder_name, f"JSON-Parsing fehlgeschlagen: {e}") from e
 
         self._validate_required_fields(raw=raw, feature_id=folder_name)
         audit_dto = self._parse_audit(folder_name, raw.get("audit"))
 
-        return FeatureDescriptorDTO(
-            id=raw["id"],
+        descriptor = FeatureDescriptorDTO(
+            id=sys.intern(raw["id"]),
             label=raw["label"],
             version=raw["version"],
             main_class=raw["main_class"],
-            visible_for=raw.get("visible_for", []),
+            visible_for=self._intern_strings(raw.get("visible_for", ())),
             is_core=raw.get("is_core", False),
             sort_order=raw.get("sort_order", 999),
             requires_login=raw.get("requires_login", True),
-            dependencies=raw.get("dependencies", []),
+            dependencies=self._intern_strings(raw.get("dependencies", ())),
             audit=audit_dto,
             description=raw.get("description"),
             icon=raw.get("icon"),
         )
+        # Gleiche Descriptors (z.B. mehrere Repositories/Reloads) teilen sich eine Instanz
+        return FeatureDescriptorDTO.intern(descriptor)
 
     def _validate_required_fields(self, raw: Dict[str, Any], feature_id: str) -> None:
-        required_fields = ["id", "label", "version", "main_class"]
-        for field in required_fields:
+        for field in self.REQUIRED_FIELDS:
             if not raw.get(field):
                 raise InvalidMetaException(feature_id, f"Missing required field: {field}")
 
@@ -151,23 +545,20 @@ class FeatureRepository:
             )
 
         # ✅ Test erwartet Substring "semantic versioning"
-        if not self.VERSION_PATTERN.match(raw["version"]):
+        if not self._is_semver(raw["version"]):
             raise InvalidMetaException(
                 feature_id,
                 f"version must follow semantic versioning (X.Y.Z), got '{raw['version']}'",
             )
 
-        if "visible_for" in raw and not isinstance(raw["visible_for"], list):
-            raise InvalidMetaException(feature_id, "visible_for must be a list")
+        for field, expected_type, message in self.TYPE_CHECKS:
+            if field in raw and not isinstance(raw[field], expected_type):
+                raise InvalidMetaException(feature_id, message)
 
-        if "dependencies" in raw and not isinstance(raw["dependencies"], list):
-            raise InvalidMetaException(feature_id, "dependencies must be a list")
-
-        if "is_core" in raw and not isinstance(raw["is_core"], bool):
-            raise InvalidMetaException(feature_id, "is_core must be a boolean")
-
-        if "requires_login" in raw and not isinstance(raw["requires_login"], bool):
-            raise InvalidMetaException(feature_id, "requires_login must be a boolean")
+        # set(map(type, ...)) prüft die Elementtypen in C statt per Generator
+        for field in self.STRING_LIST_FIELDS:
+            if field in raw and not set(map(type, raw[field])) <= {str}:
+                raise InvalidMetaException(feature_id, f"{field} entries must be strings")
 
         if "sort_order" in raw:
             if not isinstance(raw["sort_order"], int) or raw["sort_order"] < 0:
@@ -176,6 +567,31 @@ class FeatureRepository:
                     f"sort_order must be a non-negative integer, got {raw.get('sort_order')}",
                 )
 
+    @staticmethod
+    def _intern_strings(values: List[str]) -> Tuple[str, ...]:
+        """
+        Tuple mit internierten Strings (IDs/Rollen).
+
+        Gleiche IDs und Rollennamen aus verschiedenen meta.json sind danach
+        dasselbe Objekt → Vergleiche und Dict-/Set-Lookups treffen den
+        Identitäts-Fastpath. Die Einträge sind durch STRING_LIST_FIELDS
+        bereits als Strings validiert.
+        """
+        return tuple(sys.intern(v) for v in values)
+
+    @staticmethod
+    def _is_semver(version: Any) -> bool:
+        """
+        Prüft X.Y.Z (nur Ziffern) ohne Regex-Engine.
+
+        isdecimal() entspricht \\d; anders als das frühere ^...$ wird ein
+        abschließendes Newline nicht akzeptiert.
+        """
+        if not isinstance(version, str):
+            return False
+        parts = version.split(".")
+        return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
     def _parse_audit(self, feature_id: str, raw_audit: Any) -> Optional[AuditConfigDTO]:
         if raw_audit is None:
             return None
@@ -188,10 +604,12 @@ class FeatureRepository:
             raise InvalidMetaException(feature_id, "audit.must_audit must be a boolean")
 
         min_log_level = raw_audit.get("min_log_level", "INFO")
-        if min_log_level not in self.VALID_LOG_LEVELS:
+        # isinstance zuerst: unhashbare Werte (z.B. Listen) würden sonst beim
+        # frozenset-Lookup TypeError werfen
+        if not isinstance(min_log_level, str) or min_log_level not in self.VALID_LOG_LEVELS:
             raise InvalidMetaException(
                 feature_id,
-                f"audit.min_log_level must be one of {self.VALID_LOG_LEVELS}, got '{min_log_level}'",
+                f"audit.min_log_level must be one of {self.VALID_LOG_LEVELS_TEXT}, got '{min_log_level}'",
             )
 
         critical_actions = raw_audit.get("critical_actions", [])
@@ -208,6 +626,7 @@ class FeatureRepository:
         return AuditConfigDTO(
             must_audit=must_audit,
             min_log_level=min_log_level,
-            critical_actions=critical_actions,
+            # Tuple: Descriptors werden prozessweit geteilt (Parse-Cache, intern())
+            critical_actions=tuple(critical_actions),
             retention_days=retention_days,
         )
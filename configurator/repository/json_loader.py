@@ -0,0 +1,54 @@
+"""
+JSON-Laden für meta.json und app_config.json.
+
+orjson, falls installiert, sonst stdlib json. Beide parsen direkt aus
+bytes und werfen bei ungültigem JSON json.JSONDecodeError (bzw. eine
+Unterklasse davon).
+
+Author: QMToolV6 Development Team
+Version: 1.0.0
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:  # optional: orjson
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """
+    Parst bereits gelesene JSON-bytes (UTF-8) mit dem schnellsten verfügbaren Parser.
+
+    Raises:
+        JSONDecodeError: Bei ungültigem JSON
+    """
+    return _loads(data)
+
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Liest und parst eine JSON-Datei (UTF-8).
+
+    Die Datei wird als bytes gelesen; kein separater decode()-Schritt.
+
+    Args:
+        path: Pfad zur JSON-Datei
+
+    Returns:
+        Geparster JSON-Inhalt
+
+    Raises:
+        JSONDecodeError: Bei ungültigem JSON
+        OSError: Wenn die Datei nicht gelesen werden kann
+    """
+    with open(path, "rb") as f:
+        return _loads(f.read())
@@ -8,7 +8,9 @@ Version: 1.0.0
 """
 from __future__ import annotations
 
+import heapq
 import logging
+from operator import attrgetter
 from typing import List, Optional
 
 from configurator.dto.app_config_dto import AppConfigDTO
@@ -20,6 +22,8 @@ from configurator.services.configurator_service_interface import ConfiguratorSer
 
 logger = logging.getLogger(__name__)
 
+_SORT_KEY = attrgetter("sort_order", "id")
+
 
 class ConfiguratorService(ConfiguratorServiceInterface):
     """
@@ -78,7 +82,7 @@ class ConfiguratorService(ConfiguratorServiceInterface):
         """
         logger.info("Starting feature discovery")
         descriptors = self._feature_repository.discover_all()
-        logger.info(f"Discovered {len(descriptors)} features")
+        logger.info("Discovered %d features", len(descriptors))
         return descriptors
 
     def get_feature_meta(self, feature_id: str) -> FeatureDescriptorDTO:
@@ -95,49 +99,50 @@ class ConfiguratorService(ConfiguratorServiceInterface):
             FeatureNotFoundException: Wenn Feature nicht existiert
             InvalidMetaException: Wenn meta.json ungültig ist
         """
-        logger.debug(f"Loading meta for feature:  {feature_id}")
+        logger.debug("Loading meta for feature: %s", feature_id)
         return self._feature_repository.get_by_id(feature_id)
 
     def get_all_features(
             self,
-            role: Optional[str] = None
+            role: Optional[str] = None,
+            limit: Optional[int] = None
     ) -> List[FeatureRegistryDTO]:
         """
         Gibt Registry-Einträge zurück, optional gefiltert nach Role/visible_for.
 
         Prozess:
-        1. Discover all features
-        2. Filter nach role (falls angegeben)
+        1. Features per discover_all() (ohne Änderung an den meta.json wird das
+           gemerkte Ergebnis ohne erneutes Lesen/Parsen geliefert)
+        2. Filter nach role (falls angegeben, über FeatureRepository.get_by_role)
         3. Sortiere nach sort_order, dann id
         4. Wrappen in FeatureRegistryDTO
 
         Args:
             role: Rollenname für Filterung (None = alle)
+            limit: Nur die ersten `limit` Einträge (None = alle); per Heap
+                   (O(N log K)) statt vollständiger Sortierung
 
         Returns:
             Sortierte Liste von FeatureRegistryDTO
         """
-        logger.info(f"Getting all features for role:  {role or 'ALL'}")
-
-        # Discovery
-        descriptors = self._feature_repository.discover_all()
-
-        # Rollen-Filter
-        if role is not None:
-            role_upper = str(role).upper()
-            descriptors = [
-                d for d in descriptors
-                if d.is_visible_for_role(role_upper)
-            ]
+        logger.info("Getting all features for role: %s", role or "ALL")
+
+        # discover_all() prüft nur mtime/size und parst bei unveränderten Dateien
+        # nicht neu; Rollen-Filter über den Rollen-Index des Repositories
+        if role is None:
+            descriptors = self._feature_repository.discover_all()
+        else:
+            descriptors = self._feature_repository.get_by_role(str(role))
             logger.debug(
-                f"Filtered to {len(descriptors)} features visible for role {role}"
+                "Filtered to %d features visible for role %s", len(descriptors), role
             )
 
-        # Sortierung:  sort_order (aufsteigend), dann id (alphabetisch)
-        descriptors = sorted(
-            descriptors,
-            key=lambda d: (d.sort_order, d.id)
-        )
+        # Sortierung:  sort_order (aufsteigend), dann id (alphabetisch).
+        # In-place auf der eigenen Liste; attrgetter statt lambda (C-Aufruf)
+        if limit is None:
+            descriptors.sort(key=_SORT_KEY)
+        else:
+            descriptors = heapq.nsmallest(limit, descriptors, key=_SORT_KEY)
 
         # In Registry-DTOs wrappen
         registry_dtos = [
@@ -145,7 +150,7 @@ class ConfiguratorService(ConfiguratorServiceInterface):
             for d in descriptors
         ]
 
-        logger.info(f"Returning {len(registry_dtos)} features")
+        logger.info("Returning %d features", len(registry_dtos))
         return registry_dtos
 
     def validate_meta(self, feature_id: str) -> bool:
@@ -162,7 +167,7 @@ class ConfiguratorService(ConfiguratorServiceInterface):
             FeatureNotFoundException: Wenn Feature nicht existiert
             InvalidMetaException:  Wenn meta.json ungültig ist
         """
-        logger.info(f"Validating meta for feature: {feature_id}")
+        logger.info("Validating meta for feature: %s", feature_id)
         return self._feature_repository.validate(feature_id)
 
     def get_app_config(self) -> AppConfigDTO:
@@ -90,13 +90,15 @@ class ConfiguratorServiceInterface(ABC):
     @abstractmethod
     def get_all_features(
             self,
-            role: Optional[str] = None
+            role: Optional[str] = None,
+            limit: Optional[int] = None
     ) -> List[FeatureRegistryDTO]:
         """
         Gibt Registry-Einträge zurück, optional gefiltert nach Role/visible_for.
 
         Args:
             role:  Rollenname für Filterung (None = alle Features)
+            limit: Nur die ersten `limit` Einträge der Sortierung (None = alle)
 
         Returns:
             Liste von FeatureRegistryDTO, sortiert nach sort_order und id
@@ -110,6 +112,9 @@ class ConfiguratorServiceInterface(ABC):
             >>>
             >>> # Nur für USER sichtbare Features
             >>> user_features = service.get_all_features(role="USER")
+            >>>
+            >>> # Die ersten 10 Features (z.B. Schnellzugriff-Leiste)
+            >>> top_features = service.get_all_features(limit=10)
         """
         raise NotImplementedError
 
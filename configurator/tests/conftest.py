@@ -6,15 +6,15 @@ Version: 1.0.0
 """
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
 
 import pytest
 
 from configurator.repository.config_repository import ConfigRepository
 from configurator.repository.feature_repository import FeatureRepository
 from configurator.services.configurator_service import ConfiguratorService
+from configurator.tests.helpers import dump_json_bytes
 
 
 @pytest.fixture
@@ -76,11 +76,7 @@ def create_meta_json(
         meta_data: Dict mit Meta-Daten
     """
     folder.mkdir(parents=True, exist_ok=True)
-    meta_path = folder / "meta.json"
-    meta_path.write_text(
-        json.dumps(meta_data, indent=2),
-        encoding="utf-8"
-    )
+    (folder / "meta.json").write_bytes(dump_json_bytes(meta_data))
 
 
 def create_app_config_json(
@@ -96,21 +92,11 @@ def create_app_config_json(
     """
     config_dir = project_root / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
-    config_path = config_dir / "app_config.json"
-    config_path.write_text(
-        json.dumps(config_data, indent=2),
-        encoding="utf-8"
-    )
+    (config_dir / "app_config.json").write_bytes(dump_json_bytes(config_data))
 
 
-@pytest.fixture
-def sample_feature_meta() -> Dict[str, Any]:
-    """
-    Sample Feature meta.json.
-
-    Returns:
-        Dict mit gültigen Meta-Daten
-    """
+def _sample_feature_meta_data() -> Dict[str, Any]:
+    """Gültige meta.json (neues Dict pro Aufruf)."""
     return {
         "id": "authenticator",
         "label": "Authenticator",
@@ -133,13 +119,29 @@ def sample_feature_meta() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def sample_app_config() -> Dict[str, Any]:
+def sample_feature_meta() -> Dict[str, Any]:
     """
-    Sample app_config.json.
+    Sample Feature meta.json.
 
     Returns:
-        Dict mit gültiger App-Config
+        Dict mit gültigen Meta-Daten
+    """
+    return _sample_feature_meta_data()
+
+
+@pytest.fixture(scope="session")
+def sample_feature_meta_bytes() -> bytes:
     """
+    sample_feature_meta einmal pro Session als JSON-bytes serialisiert.
+
+    Returns:
+        UTF-8 JSON, direkt für Path.write_bytes()
+    """
+    return dump_json_bytes(_sample_feature_meta_data())
+
+
+def _sample_app_config_data() -> Dict[str, Any]:
+    """Gültige App-Config (neues Dict pro Aufruf)."""
     return {
         "app_name": "QMToolV6",
         "app_version": "1.0.0",
@@ -159,4 +161,42 @@ def sample_app_config() -> Dict[str, Any]:
             "data_dir": "./test_data",
             "temp_dir": "./test_temp"
         }
-    }
\ No newline at end of file
+    }
+
+
+@pytest.fixture
+def sample_app_config() -> Dict[str, Any]:
+    """
+    Sample app_config.json.
+
+    Returns:
+        Dict mit gültiger App-Config
+    """
+    return _sample_app_config_data()
+
+
+@pytest.fixture(scope="session")
+def sample_app_config_bytes() -> bytes:
+    """
+    sample_app_config einmal pro Session als JSON-bytes serialisiert.
+
+    Returns:
+        UTF-8 JSON, direkt für Path.write_bytes()
+    """
+    return dump_json_bytes(_sample_app_config_data())
+
+
+@pytest.fixture(scope="session")
+def prebuilt_app_config_repo(
+        tmp_path_factory: pytest.TempPathFactory
+) -> Tuple[ConfigRepository, Path]:
+    """
+    Einmal pro Session: Temp-Root mit config/app_config.json (= sample_app_config)
+    und ConfigRepository darauf. Nur für Tests, die nichts verändern.
+
+    Returns:
+        (ConfigRepository, Projekt-Root)
+    """
+    project_root = tmp_path_factory.mktemp("prebuilt_app_config")
+    create_app_config_json(project_root, _sample_app_config_data())
+    return ConfigRepository(project_root=str(project_root)), project_root
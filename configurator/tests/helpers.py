@@ -0,0 +1,22 @@
+"""
+Test-Helfer für Configurator (ohne Fixtures).
+
+Author: QMToolV6 Development Team
+Version: 1.0.0
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional: orjson (schneller als json.dumps + encode)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialisiert data eingerückt als UTF-8-bytes (orjson, sonst json)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
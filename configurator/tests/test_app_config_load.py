@@ -8,13 +8,34 @@ Version: 1.1.0
 """
 from __future__ import annotations
 
-import json
+import dataclasses
 from pathlib import Path
+from typing import Any, Dict, Tuple, Union
 
 import pytest
 
+from configurator.dto.app_config_dto import AppConfigDTO
 from configurator.exceptions.config_validation_exception import ConfigValidationException
 from configurator. repository.config_repository import ConfigRepository
+from configurator.tests.helpers import dump_json_bytes
+
+# Vorab serialisierte, ungültige Inhalte
+_INVALID_JSON = b"{ invalid json"
+_TRUNCATED_JSON = b"{ invalid"
+
+
+def _write_app_config(project_root: Path, payload: Union[bytes, Any]) -> None:
+    """
+    Helper: Schreibt config/app_config.json.
+
+    Args:
+        project_root: Projekt-Root (existiert bereits → mkdir ohne parents)
+        payload: Fertige bytes (z.B. ungültiges JSON) oder JSON-serialisierbarer Wert
+    """
+    config_dir = project_root / "config"
+    config_dir.mkdir(exist_ok=True)
+    data = payload if isinstance(payload, bytes) else dump_json_bytes(payload)
+    (config_dir / "app_config.json").write_bytes(data)
 
 
 class TestAppConfigDefaults:
@@ -49,20 +70,13 @@ class TestAppConfigOverrides:
 
     def test_load_app_config_applies_overrides(
         self,
-        temp_features_root:  Path,
-        sample_app_config: dict
+        prebuilt_app_config_repo: Tuple[ConfigRepository, Path]
     ) -> None:
         """Lädt Overrides aus app_config.json."""
-        # Arrange:  config/app_config.json erstellen
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(sample_app_config),
-            encoding="utf-8"
-        )
+        # Arrange:  config/app_config.json (sample_app_config) einmal pro Session
+        repo, _ = prebuilt_app_config_repo
 
         # Act
-        repo = ConfigRepository(project_root=str(temp_features_root))
         config = repo.load_app_config()
 
         # Assert: Overrides angewendet
@@ -89,12 +103,7 @@ class TestAppConfigOverrides:
             }
         }
 
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(partial_config),
-            encoding="utf-8"
-        )
+        _write_app_config(temp_features_root, partial_config)
 
         # Act
         repo = ConfigRepository(project_root=str(temp_features_root))
@@ -109,18 +118,19 @@ class TestAppConfigOverrides:
 class TestAppConfigValidation:
     """Tests für Config-Validierung."""
 
-    def test_invalid_json_uses_defaults_non_strict(
+    @pytest.mark.parametrize(
+        "payload",
+        [_INVALID_JSON, ["array", "not", "object"]],
+        ids=["invalid_json", "non_object_root"],
+    )
+    def test_unusable_file_uses_defaults_non_strict(
         self,
-        temp_features_root: Path
+        temp_features_root: Path,
+        payload: Any
     ) -> None:
-        """Ungültiges JSON führt zu Defaults (nicht-strict)."""
-        # Arrange: Ungültiges JSON
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            "{ invalid json",
-            encoding="utf-8"
-        )
+        """Ungültiges JSON / Nicht-Objekt-Root führt zu Defaults (nicht-strict)."""
+        # Arrange
+        _write_app_config(temp_features_root, payload)
 
         # Act
         repo = ConfigRepository(project_root=str(temp_features_root))
@@ -135,91 +145,45 @@ class TestAppConfigValidation:
     ) -> None:
         """Ungültiges JSON wirft Exception (strict)."""
         # Arrange: Ungültiges JSON
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            "{ invalid",
-            encoding="utf-8"
-        )
+        _write_app_config(temp_features_root, _TRUNCATED_JSON)
 
         # Act & Assert
         repo = ConfigRepository(project_root=str(temp_features_root))
         with pytest.raises(ConfigValidationException):
             repo.load_app_config(strict=True)
 
-    def test_non_object_root_uses_defaults(
-        self,
-        temp_features_root: Path
-    ) -> None:
-        """Nicht-Objekt-Root führt zu Defaults."""
-        # Arrange: JSON ist Array statt Objekt
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(["array", "not", "object"]),
-            encoding="utf-8"
-        )
-
-        # Act
-        repo = ConfigRepository(project_root=str(temp_features_root))
-        config = repo.load_app_config()
-
-        # Assert: Defaults verwendet
-        assert config.db_path == "qmtool.db"
-
-    def test_invalid_int_values_use_defaults(
-        self,
-        temp_features_root: Path
-    ) -> None:
-        """Ungültige Int-Werte verwenden Defaults."""
-        # Arrange: timeout_minutes ist String statt Int
-        invalid_config = {
-            "session": {
-                "timeout_minutes": "not_a_number",
-                "max_failed_logins": 3
-            }
-        }
-
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(invalid_config),
-            encoding="utf-8"
-        )
-
-        # Act
-        repo = ConfigRepository(project_root=str(temp_features_root))
-        config = repo.load_app_config()
-
-        # Assert: timeout_minutes verwendet Default, max_failed_logins OK
-        assert config.session_timeout_minutes == 60  # Default
-        assert config.max_failed_logins == 3  # Aus config
-
-    def test_negative_values_use_defaults(
+    @pytest.mark.parametrize(
+        "payload, expected",
+        [
+            # timeout_minutes ist String statt Int → Default, max_failed_logins OK
+            (
+                {"session": {"timeout_minutes": "not_a_number", "max_failed_logins": 3}},
+                {"session_timeout_minutes": 60, "max_failed_logins": 3},
+            ),
+            # retention_days < 0 → Default wegen min_value=1 Validierung
+            (
+                {"audit": {"default_retention_days": -100}},
+                {"default_retention_days": 365},
+            ),
+        ],
+        ids=["invalid_int", "negative_value"],
+    )
+    def test_invalid_values_use_defaults(
         self,
-        temp_features_root: Path
+        temp_features_root: Path,
+        payload: Dict[str, Any],
+        expected: Dict[str, Any]
     ) -> None:
-        """Negative Werte verwenden Defaults (min_value Check)."""
-        # Arrange: retention_days < 0
-        invalid_config = {
-            "audit": {
-                "default_retention_days": -100
-            }
-        }
-
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(invalid_config),
-            encoding="utf-8"
-        )
+        """Ungültige Einzelwerte verwenden Defaults, gültige bleiben erhalten."""
+        # Arrange
+        _write_app_config(temp_features_root, payload)
 
         # Act
         repo = ConfigRepository(project_root=str(temp_features_root))
         config = repo.load_app_config()
 
-        # Assert: Verwendet Default wegen min_value=1 Validierung
-        assert config.default_retention_days == 365  # Default
+        # Assert
+        assert {name: getattr(config, name) for name in expected} == expected
 
 
 class TestAppConfigDTOMethods:
@@ -227,19 +191,11 @@ class TestAppConfigDTOMethods:
 
     def test_get_db_path_returns_path_object(
         self,
-        temp_features_root: Path,
-        sample_app_config: dict
+        prebuilt_app_config_repo: Tuple[ConfigRepository, Path]
     ) -> None:
         """get_db_path() gibt Path-Objekt zurück."""
         # Arrange
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(sample_app_config),
-            encoding="utf-8"
-        )
-
-        repo = ConfigRepository(project_root=str(temp_features_root))
+        repo, _ = prebuilt_app_config_repo
         config = repo.load_app_config()
 
         # Act
@@ -251,20 +207,12 @@ class TestAppConfigDTOMethods:
 
     def test_get_data_dir_returns_path_object(
         self,
-        temp_features_root: Path,
-        sample_app_config: dict
+        prebuilt_app_config_repo: Tuple[ConfigRepository, Path]
     ) -> None:
         """get_data_dir() gibt Path-Objekt zurück."""
         # Arrange
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(sample_app_config),
-            encoding="utf-8"
-        )
-
-        repo = ConfigRepository(project_root=str(temp_features_root))
-        config = repo. load_app_config()
+        repo, _ = prebuilt_app_config_repo
+        config = repo.load_app_config()
 
         # Act
         data_dir = config.get_data_dir()
@@ -277,7 +225,6 @@ class TestAppConfigDTOMethods:
     def test_validate_raises_on_invalid_values(self) -> None:
         """validate() wirft ValueError bei ungültigen Werten."""
         # Arrange & Act & Assert
-        from configurator.dto.app_config_dto import AppConfigDTO
 
         # session_timeout_minutes <= 0
         with pytest.raises(ValueError, match="session_timeout_minutes must be > 0"):
@@ -297,4 +244,14 @@ class TestAppConfigDTOMethods:
         # invalid log_level
         with pytest.raises(ValueError, match="default_log_level must be one of"):
             config = AppConfigDTO(default_log_level="INVALID")
-            config.validate()
\ No newline at end of file
+            config.validate()
+
+    def test_path_objects_are_reused(self) -> None:
+        """get_*-Methoden liefern dasselbe Path-Objekt; DTO ist immutable."""
+        config = AppConfigDTO(db_path="x.db")
+
+        assert config.get_db_path() is config.get_db_path()
+        assert config.get_features_root() == Path(".")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.db_path = "y.db"
+        assert dataclasses.replace(config, db_path="y.db").get_db_path() == Path("y.db")
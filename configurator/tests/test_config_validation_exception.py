@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
@@ -55,50 +56,74 @@ class TestConfigValidationException:
         assert "Must be DEBUG" in exc.reason
 
 
-class TestConfigRepositoryStrictMode:
-    """Tests für ConfigRepository strict-Mode."""
+@pytest.fixture(scope="class")
+def strict_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Gemeinsames Projekt-Root (inkl. config/) für alle Strict-Mode-Tests.
 
-    def test_strict_mode_raises_on_invalid_json(
-        self,
-        temp_features_root: Path
-    ) -> None:
-        """Strict-Mode wirft Exception bei ungültigem JSON."""
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            "{ invalid json",
-            encoding="utf-8"
-        )
+    Returns:
+        Path zum temp-Verzeichnis (einmal pro Klasse erstellt)
+    """
+    root = tmp_path_factory.mktemp("strict")
+    (root / "config").mkdir()
+    return root
 
-        repo = ConfigRepository(project_root=str(temp_features_root))
-        with pytest.raises(ConfigValidationException) as exc_info:
-            repo.load_app_config(strict=True)
 
-        assert exc_info.value.field == "app_config.json"
-        assert "JSON parsing failed" in exc_info.value.reason
+@pytest.fixture(scope="class")
+def strict_repo(strict_root: Path) -> ConfigRepository:
+    """
+    ConfigRepository auf dem gemeinsamen Root (zustandslos → einmal pro Klasse).
+
+    Returns:
+        ConfigRepository-Instanz
+    """
+    return ConfigRepository(project_root=str(strict_root))
+
 
-    def test_strict_mode_raises_on_non_object_root(
+@pytest.fixture
+def app_config_path(strict_root: Path) -> Iterator[Path]:
+    """
+    Pfad zu config/app_config.json im gemeinsamen Root.
+
+    Die Datei wird nach jedem Test entfernt, damit keine Inhalte
+    zwischen Tests durchsickern.
+    """
+    path = strict_root / "config" / "app_config.json"
+    yield path
+    path.unlink(missing_ok=True)
+
+
+class TestConfigRepositoryStrictMode:
+    """Tests für ConfigRepository strict-Mode."""
+
+    @pytest.mark.parametrize(
+        "payload, expected_reason",
+        [
+            (b"{ invalid json", "JSON parsing failed"),
+            (json.dumps(["array", "not", "object"]).encode("utf-8"), "must be a JSON object"),
+        ],
+        ids=["invalid_json", "non_object_root"],
+    )
+    def test_strict_mode_raises_on_unusable_file(
         self,
-        temp_features_root: Path
+        strict_repo: ConfigRepository,
+        app_config_path: Path,
+        payload: bytes,
+        expected_reason: str
     ) -> None:
-        """Strict-Mode wirft Exception wenn Root kein Objekt ist."""
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(["array", "not", "object"]),
-            encoding="utf-8"
-        )
+        """Strict-Mode wirft Exception bei ungültigem JSON oder Nicht-Objekt-Root."""
+        app_config_path.write_bytes(payload)
 
-        repo = ConfigRepository(project_root=str(temp_features_root))
         with pytest.raises(ConfigValidationException) as exc_info:
-            repo.load_app_config(strict=True)
+            strict_repo.load_app_config(strict=True)
 
         assert exc_info.value.field == "app_config.json"
-        assert "must be a JSON object" in exc_info.value.reason
+        assert expected_reason in exc_info.value.reason
 
     def test_strict_mode_does_not_raise_on_invalid_values_but_falls_back_and_warns(
         self,
-        temp_features_root: Path,
+        strict_repo: ConfigRepository,
+        app_config_path: Path,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
         """
@@ -106,17 +131,12 @@ class TestConfigRepositoryStrictMode:
         NICHT als Exception behandelt, sondern auf Defaults zurückgesetzt
         und per WARNING geloggt.
         """
-        config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps({"session": {"timeout_minutes": -1}}, indent=2),
-            encoding="utf-8"
+        app_config_path.write_bytes(
+            json.dumps({"session": {"timeout_minutes": -1}}, indent=2).encode()
         )
 
-        repo = ConfigRepository(project_root=str(temp_features_root))
-
         with caplog.at_level("WARNING"):
-            cfg = repo.load_app_config(strict=True)
+            cfg = strict_repo.load_app_config(strict=True)
 
         # Erwartung: Fallback auf Default 60 (siehe Log aus deinem Testlauf)
         assert cfg.session_timeout_minutes == 60
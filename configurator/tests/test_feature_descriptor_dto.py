@@ -0,0 +1,78 @@
+"""
+Tests für FeatureDescriptorDTO-Helper (Rollen-Sichtbarkeit, Abhängigkeiten).
+"""
+from configurator.dto.feature_descriptor_dto import FeatureDescriptorDTO
+
+
+def _descriptor(**kwargs) -> FeatureDescriptorDTO:
+    """Erstellt einen minimalen Descriptor."""
+    return FeatureDescriptorDTO(
+        id="test",
+        label="Test",
+        version="1.0.0",
+        main_class="some.module.Class",
+        **kwargs
+    )
+
+
+def test_is_visible_for_role_case_insensitive() -> None:
+    """Rollenvergleich ignoriert Groß-/Kleinschreibung."""
+    descriptor = _descriptor(visible_for=("Admin", "qmb"))
+
+    assert descriptor.is_visible_for_role("ADMIN")
+    assert descriptor.is_visible_for_role("qmb")
+    assert not descriptor.is_visible_for_role("USER")
+
+
+def test_empty_visible_for_means_all_roles() -> None:
+    """Leeres visible_for → für alle sichtbar."""
+    assert _descriptor().is_visible_for_role("ANYONE")
+
+
+def test_has_dependency() -> None:
+    """has_dependency prüft die dependencies-Liste."""
+    descriptor = _descriptor(dependencies=("authenticator", "user_management"))
+
+    assert descriptor.has_dependency("authenticator")
+    assert not descriptor.has_dependency("documents")
+
+
+def test_lookup_sets_do_not_affect_equality() -> None:
+    """Abgeleitete Lookup-Sets erscheinen nicht in repr/eq."""
+    a = _descriptor(visible_for=("ADMIN",))
+    b = _descriptor(visible_for=("ADMIN",))
+
+    assert a == b
+    assert "_visible_for_upper" not in repr(a)
+
+
+def test_dtos_have_no_instance_dict() -> None:
+    """Descriptor, Registry-Eintrag und Audit-Config sind slotted."""
+    from configurator.dto.audit_config_dto import AuditConfigDTO
+    from configurator.dto.feature_registry_dto import FeatureRegistryDTO
+
+    descriptor = _descriptor(audit=AuditConfigDTO())
+    entry = FeatureRegistryDTO(descriptor=descriptor)
+
+    for dto in (descriptor, entry, descriptor.audit):
+        assert not hasattr(dto, "__dict__")
+    assert entry.get_feature_id() == "test"
+
+
+def test_intern_shares_equal_descriptors() -> None:
+    """Gleiche Descriptors → dieselbe Instanz; geänderter Inhalt ersetzt."""
+    first = FeatureDescriptorDTO.intern(_descriptor(visible_for=("ADMIN",)))
+    same = FeatureDescriptorDTO.intern(_descriptor(visible_for=("ADMIN",)))
+    changed = FeatureDescriptorDTO.intern(_descriptor(visible_for=("USER",)))
+
+    assert same is first
+    assert changed is not first
+    assert FeatureDescriptorDTO.intern(_descriptor(visible_for=("USER",))) is changed
+
+
+def test_registry_entry_availability() -> None:
+    """is_available ist False, sobald ein Fehler gesetzt ist."""
+    from configurator.dto.feature_registry_dto import FeatureRegistryDTO
+
+    assert FeatureRegistryDTO(descriptor=_descriptor()).is_available()
+    assert not FeatureRegistryDTO(descriptor=_descriptor(), error="boom").is_available()
@@ -9,13 +9,17 @@ Version: 1.0.0
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
 
 import pytest
 
 from configurator.exceptions. feature_not_found_exception import FeatureNotFoundException
 from configurator.exceptions.invalid_meta_exception import InvalidMetaException
 from configurator.repository.feature_repository import FeatureRepository
+from configurator.tests.helpers import dump_json_bytes
 
 
 class TestFeatureDiscovery:
@@ -27,18 +31,17 @@ class TestFeatureDiscovery:
         sample_feature_meta: dict
     ) -> None:
         """Discovery findet alle gültigen Features."""
-        # Arrange:   3 Features erstellen
-        for feature_id in ["authenticator", "user_management", "audittrail"]:
-            meta = sample_feature_meta.copy()
-            meta["id"] = feature_id
-            meta["label"] = feature_id. title()
-
-            feature_dir = temp_features_root / feature_id
-            feature_dir.mkdir(parents=True, exist_ok=True)
-            (feature_dir / "meta.json").write_text(
-                json.dumps(meta),
-                encoding="utf-8"
+        # Arrange:   3 Features erstellen (meta.json vorab serialisiert)
+        blobs = {
+            feature_id: dump_json_bytes(
+                {**sample_feature_meta, "id": feature_id, "label": feature_id.title()}
             )
+            for feature_id in ("authenticator", "user_management", "audittrail")
+        }
+        for feature_id, blob in blobs.items():
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir()
+            (feature_dir / "meta.json").write_bytes(blob)
 
         # Act
         repo = FeatureRepository(features_root=str(temp_features_root))
@@ -59,21 +62,15 @@ class TestFeatureDiscovery:
         # Gültiges Feature
         auth_meta = sample_feature_meta.copy()
         auth_dir = temp_features_root / "authenticator"
-        auth_dir.mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json.dumps(auth_meta),
-            encoding="utf-8"
-        )
+        auth_dir.mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(json.dumps(auth_meta).encode())
 
         # Ignorierter Ordner (shared)
         shared_meta = sample_feature_meta.copy()
         shared_meta["id"] = "shared"
         shared_dir = temp_features_root / "shared"
-        shared_dir.mkdir(parents=True, exist_ok=True)
-        (shared_dir / "meta.json").write_text(
-            json.dumps(shared_meta),
-            encoding="utf-8"
-        )
+        shared_dir.mkdir(exist_ok=True)
+        (shared_dir / "meta.json").write_bytes(json.dumps(shared_meta).encode())
 
         # Act
         repo = FeatureRepository(features_root=str(temp_features_root))
@@ -89,7 +86,7 @@ class TestFeatureDiscovery:
     ) -> None:
         """Discovery überspringt Ordner ohne meta.json."""
         # Arrange:  Ordner ohne meta.json
-        (temp_features_root / "no_meta").mkdir(parents=True, exist_ok=True)
+        (temp_features_root / "no_meta").mkdir(exist_ok=True)
 
         # Act
         repo = FeatureRepository(features_root=str(temp_features_root))
@@ -98,6 +95,115 @@ class TestFeatureDiscovery:
         # Assert
         assert len(features) == 0
 
+    def test_discover_missing_root_returns_empty(
+        self,
+        temp_features_root: Path
+    ) -> None:
+        """Nicht existierender Root oder Datei als Root → leere Liste."""
+        # Arrange
+        (temp_features_root / "file.txt").write_bytes(b"x")
+
+        # Act & Assert
+        assert FeatureRepository(features_root=str(temp_features_root / "missing")).discover_all() == []
+        assert FeatureRepository(features_root=str(temp_features_root / "file.txt")).discover_all() == []
+
+    def test_discover_unreadable_root_returns_empty(
+        self,
+        temp_features_root: Path
+    ) -> None:
+        """PermissionError beim Lesen des Roots → leere Liste statt Exception."""
+        # Arrange
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        with patch("os.scandir", side_effect=PermissionError("denied")):
+            features = repo.discover_all()
+
+        # Assert
+        assert features == []
+
+    def test_discover_accepts_unnormalized_root(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Root mit '..'-Komponenten wird normalisiert."""
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
+        (temp_features_root / "nested").mkdir()
+
+        # Act
+        repo = FeatureRepository(features_root=str(temp_features_root / "nested" / ".."))
+        features = repo.discover_all()
+
+        # Assert
+        assert [f.id for f in features] == ["authenticator"]
+        assert repo.get_by_id("authenticator") is features[0]
+
+    def test_discover_skips_plain_files_in_root(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """Dateien auf Level 1 (kein Ordner) werden ignoriert."""
+        # Arrange
+        (temp_features_root / "authenticator").write_bytes(b"not a folder")
+
+        # Act
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Assert
+        assert repo.discover_all() == []
+
+    def test_discover_parallel_keeps_folder_order(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """Paralleles Laden (ab Schwellwert) liefert dieselbe Reihenfolge wie seriell."""
+        # Arrange
+        count = FeatureRepository.PARALLEL_LOAD_THRESHOLD + 2
+        feature_ids = [f"feature_{i:02d}" for i in range(count)]
+        for feature_id in reversed(feature_ids):
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir()
+            (feature_dir / "meta.json").write_bytes(
+                json.dumps({**sample_feature_meta, "id": feature_id}).encode()
+            )
+
+        # Act
+        features = FeatureRepository(features_root=str(temp_features_root)).discover_all()
+
+        # Assert
+        assert [f.id for f in features] == feature_ids
+
+    def test_discover_parallel_raises_first_invalid_in_order(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """Strict-Mode meldet auch parallel den ersten ungültigen Ordner."""
+        # Arrange
+        count = FeatureRepository.PARALLEL_LOAD_THRESHOLD + 2
+        for i in range(count):
+            feature_id = f"feature_{i:02d}"
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir()
+            content = (
+                b"{ invalid" if i in (3, 7)
+                else json.dumps({**sample_feature_meta, "id": feature_id}).encode()
+            )
+            (feature_dir / "meta.json").write_bytes(content)
+
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act & Assert
+        with pytest.raises(InvalidMetaException) as exc_info:
+            repo.discover_all()
+        assert exc_info.value.feature_id == "feature_03"
+
     def test_discover_raises_on_invalid_meta(
         self,
         temp_features_root: Path
@@ -105,11 +211,8 @@ class TestFeatureDiscovery:
         """Discovery wirft Exception bei ungültiger meta.json."""
         # Arrange:  Ungültige JSON
         feature_dir = temp_features_root / "broken"
-        feature_dir.mkdir(parents=True, exist_ok=True)
-        (feature_dir / "meta.json").write_text(
-            "{ invalid json",
-            encoding="utf-8"
-        )
+        feature_dir.mkdir(exist_ok=True)
+        (feature_dir / "meta.json").write_bytes(b"{ invalid json")
 
         # Act & Assert
         repo = FeatureRepository(features_root=str(temp_features_root))
@@ -121,16 +224,14 @@ class TestFeatureDiscovery:
     def test_discover_caches_descriptors(
         self,
         temp_features_root: Path,
-        sample_feature_meta: dict
+        sample_feature_meta: dict,
+        sample_feature_meta_bytes: bytes
     ) -> None:
         """Cache wird für get_by_id() verwendet."""
         # Arrange
         auth_dir = temp_features_root / "authenticator"
-        auth_dir.mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json.dumps(sample_feature_meta),
-            encoding="utf-8"
-        )
+        auth_dir.mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
 
         repo = FeatureRepository(features_root=str(temp_features_root))
 
@@ -138,13 +239,11 @@ class TestFeatureDiscovery:
         features_1 = repo.discover_all()
         assert features_1[0].version == "1.0.0"
 
-        # meta.json ändern
-        modified_meta = sample_feature_meta. copy()
-        modified_meta["version"] = "2.0.0"
-        (auth_dir / "meta.json").write_text(
-            json.dumps(modified_meta),
-            encoding="utf-8"
-        )
+        # meta.json atomar ersetzen (vorab serialisiert, Rename statt Rewrite)
+        modified_bytes = json.dumps({**sample_feature_meta, "version": "2.0.0"}).encode()
+        staged_path = auth_dir / "meta.json.tmp"
+        staged_path.write_bytes(modified_bytes)
+        os.replace(staged_path, auth_dir / "meta.json")
 
         # get_by_id() nutzt Cache
         descriptor_cached = repo.get_by_id("authenticator")
@@ -160,6 +259,317 @@ class TestFeatureDiscovery:
         descriptor_new = repo.get_by_id("authenticator")
         assert descriptor_new.version == "2.0.0"  # Cache aktualisiert
 
+    def test_discover_all_reuses_result_for_unchanged_files(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Unveränderte (nicht "racy") meta.json-Dateien werden nicht neu geparst."""
+        # Arrange: meta.json mit altem Zeitstempel
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        meta_path = auth_dir / "meta.json"
+        meta_path.write_bytes(sample_feature_meta_bytes)
+        os.utime(meta_path, ns=(1_000_000_000, 1_000_000_000))
+
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        with patch.object(repo, "_load_and_validate", wraps=repo._load_and_validate) as load:
+            first = repo.discover_all()
+            second = repo.discover_all()
+
+            modified_meta = {**sample_feature_meta, "version": "2.0.0"}
+            meta_path.write_bytes(json.dumps(modified_meta).encode())
+            os.utime(meta_path, ns=(2_000_000_000, 2_000_000_000))
+            third = repo.discover_all()
+
+        # Assert
+        assert second == first
+        assert third[0].version == "2.0.0"
+        assert load.call_count == 2
+
+    def test_discover_all_rescans_recently_modified_files(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Frisch geschriebene meta.json (racy mtime) wird jedes Mal neu gelesen."""
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
+
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        with patch.object(repo, "_load_and_validate", wraps=repo._load_and_validate) as load:
+            repo.discover_all()
+            repo.discover_all()
+
+        # Assert
+        assert load.call_count == 2
+
+    def test_parse_cache_shared_across_repositories(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Zweites Repository auf denselben (unveränderten) Dateien parst nicht neu."""
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        meta_path = auth_dir / "meta.json"
+        meta_path.write_bytes(sample_feature_meta_bytes)
+        os.utime(meta_path, ns=(1_000_000_000, 1_000_000_000))
+
+        first = FeatureRepository(features_root=str(temp_features_root)).discover_all()
+        second_repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        with patch.object(second_repo, "_parse_meta_file") as parse:
+            second = second_repo.discover_all()
+
+        # Assert
+        parse.assert_not_called()
+        assert second[0] is first[0]
+
+    def test_unchanged_content_skips_reparse(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """Neu geschriebene, aber inhaltsgleiche meta.json wird nicht neu geparst."""
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        meta_path = auth_dir / "meta.json"
+        content = json.dumps(sample_feature_meta).encode()
+        meta_path.write_bytes(content)
+
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        first = repo.discover_all()
+        meta_path.write_bytes(content)
+        os.utime(meta_path)
+
+        # Act
+        with patch.object(repo, "_build_descriptor") as build:
+            second = repo.discover_all()
+
+        # Assert
+        build.assert_not_called()
+        assert second[0] is first[0]
+
+    def test_invalidate_forces_rescan(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """invalidate() verwirft gemerktes Ergebnis und Descriptor-Cache."""
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        meta_path = auth_dir / "meta.json"
+        meta_path.write_bytes(sample_feature_meta_bytes)
+        os.utime(meta_path, ns=(1_000_000_000, 1_000_000_000))
+
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        repo.discover_all()
+
+        # Act
+        repo.invalidate()
+        with patch.object(repo, "_load_and_validate", wraps=repo._load_and_validate) as load:
+            repo.discover_all()
+
+        # Assert
+        assert load.call_count == 1
+
+    def test_fs_event_invalidates_only_affected_feature(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """meta.json-Event verwirft nur den Cache-Eintrag des betroffenen Features."""
+        # Arrange
+        for feature_id in ("authenticator", "audittrail"):
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir()
+            (feature_dir / "meta.json").write_bytes(
+                json.dumps({**sample_feature_meta, "id": feature_id}).encode()
+            )
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        repo.discover_all()
+
+        # Act
+        repo._on_fs_event(str(temp_features_root / "authenticator" / "README.md"), False)
+        repo._on_fs_event(str(temp_features_root / "qmtool.db"), False)
+        assert set(repo._cache) == {"authenticator", "audittrail"}
+
+        repo._on_fs_event(str(temp_features_root / "authenticator" / "meta.json"), False)
+
+        # Assert
+        assert set(repo._cache) == {"audittrail"}
+
+    def test_handler_forwards_moved_meta_json(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """watchdog-Handler leitet Quell- und Zielpfad an _on_fs_event weiter."""
+        events = pytest.importorskip("watchdog.events")
+        from configurator.repository.feature_repository import _MetaJsonChangeHandler
+
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        repo.discover_all()
+        handler = _MetaJsonChangeHandler(repo)
+
+        # Act: Atomares Ersetzen (meta.json.tmp → meta.json)
+        handler.dispatch(events.FileMovedEvent(
+            str(auth_dir / "meta.json.tmp"), str(auth_dir / "meta.json")
+        ))
+
+        # Assert
+        assert "authenticator" not in repo._cache
+        assert repo._discover_signature is None
+
+    def test_watch_picks_up_meta_change(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Mit watch=True sieht get_by_id() Änderungen ohne discover_all()."""
+        pytest.importorskip("watchdog")
+        import time
+
+        # Arrange
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        meta_path = auth_dir / "meta.json"
+        meta_path.write_bytes(sample_feature_meta_bytes)
+
+        repo = FeatureRepository(features_root=str(temp_features_root), watch=True)
+        try:
+            assert repo.get_by_id("authenticator").version == "1.0.0"
+
+            # Act
+            meta_path.write_bytes(json.dumps({**sample_feature_meta, "version": "2.0.0"}).encode())
+            deadline = time.monotonic() + 5
+            while "authenticator" in repo._cache and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            # Assert
+            assert repo.get_by_id("authenticator").version == "2.0.0"
+        finally:
+            repo.close()
+
+
+class TestGetByRole:
+    """Tests für get_by_role() und den Rollen-Index."""
+
+    @staticmethod
+    def _create_role_features(root: Path, meta: dict, age_ns: Optional[int]) -> None:
+        for feature_id, visible_for in (
+            ("admin_only", ["ADMIN"]),
+            ("public", []),
+            ("user_qmb", ["user", "QMB", "USER"]),
+        ):
+            feature_meta = {**meta, "id": feature_id, "visible_for": visible_for}
+            feature_dir = root / feature_id
+            feature_dir.mkdir()
+            meta_path = feature_dir / "meta.json"
+            meta_path.write_bytes(json.dumps(feature_meta).encode())
+            if age_ns is not None:
+                os.utime(meta_path, ns=(age_ns, age_ns))
+
+    @pytest.mark.parametrize("age_ns", [None, 1_000_000_000], ids=["racy", "memoized"])
+    def test_get_by_role_filters_in_discovery_order(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict,
+        age_ns: Optional[int]
+    ) -> None:
+        """Rollen-Filter mit und ohne gemerkten Scan, inkl. unbekannter Rolle."""
+        # Arrange
+        self._create_role_features(temp_features_root, sample_feature_meta, age_ns)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act & Assert
+        assert [d.id for d in repo.get_by_role("admin")] == ["admin_only", "public"]
+        assert [d.id for d in repo.get_by_role("USER")] == ["public", "user_qmb"]
+        assert [d.id for d in repo.get_by_role("GUEST")] == ["public"]
+
+    def test_role_index_built_once_per_discovery(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """Index wird nur nach einem neuen Discovery-Ergebnis neu gebaut."""
+        # Arrange
+        self._create_role_features(temp_features_root, sample_feature_meta, 1_000_000_000)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        with patch.object(repo, "_build_role_index", wraps=repo._build_role_index) as build:
+            repo.get_by_role("ADMIN")
+            repo.get_by_role("QMB")
+            repo.invalidate()
+            repo.get_by_role("ADMIN")
+
+        # Assert
+        assert build.call_count == 2
+
+    def test_role_index_built_from_snapshot_despite_concurrent_invalidate(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """invalidate() während des Index-Baus koppelt den Index nicht an ein anderes Ergebnis."""
+        # Arrange
+        self._create_role_features(temp_features_root, sample_feature_meta, 1_000_000_000)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        build_role_index = repo._build_role_index
+
+        def build_with_concurrent_invalidate(descriptors):
+            repo.invalidate()  # wie ein watchdog-Event mitten im Aufruf
+            return build_role_index(descriptors)
+
+        # Act
+        with patch.object(repo, "_build_role_index", side_effect=build_with_concurrent_invalidate):
+            admin_ids = [d.id for d in repo.get_by_role("ADMIN")]
+
+        # Assert
+        assert admin_ids == ["admin_only", "public"]
+        source, index, _ = repo._role_index
+        assert [d.id for d in source] == ["admin_only", "public", "user_qmb"]
+        assert [d.id for d in index["ADMIN"]] == ["admin_only", "public"]
+
+    def test_get_by_role_sees_feature_added_after_index_build(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta: dict
+    ) -> None:
+        """Ein neues Feature erscheint, obwohl der Index bereits gebaut war."""
+        # Arrange
+        self._create_role_features(temp_features_root, sample_feature_meta, 1_000_000_000)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        assert [d.id for d in repo.get_by_role("ADMIN")] == ["admin_only", "public"]
+
+        # Act
+        feature_dir = temp_features_root / "admin_tools"
+        feature_dir.mkdir()
+        (feature_dir / "meta.json").write_bytes(
+            json.dumps({**sample_feature_meta, "id": "admin_tools", "visible_for": ["ADMIN"]}).encode()
+        )
+
+        # Assert
+        assert [d.id for d in repo.get_by_role("ADMIN")] == ["admin_only", "admin_tools", "public"]
+
 
 class TestGetFeatureById:
     """Tests für get_by_id()."""
@@ -167,16 +577,13 @@ class TestGetFeatureById:
     def test_get_by_id_returns_cached_descriptor(
         self,
         temp_features_root: Path,
-        sample_feature_meta: dict
+        sample_feature_meta_bytes: bytes
     ) -> None:
         """get_by_id nutzt Cache nach Discovery."""
         # Arrange
         auth_dir = temp_features_root / "authenticator"
-        auth_dir.mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json.dumps(sample_feature_meta),
-            encoding="utf-8"
-        )
+        auth_dir.mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
 
         repo = FeatureRepository(features_root=str(temp_features_root))
         repo.discover_all()  # Füllt Cache
@@ -191,16 +598,13 @@ class TestGetFeatureById:
     def test_get_by_id_loads_from_disk_if_not_cached(
         self,
         temp_features_root: Path,
-        sample_feature_meta: dict
+        sample_feature_meta_bytes: bytes
     ) -> None:
         """get_by_id lädt von Disk wenn nicht im Cache."""
         # Arrange
         auth_dir = temp_features_root / "authenticator"
-        auth_dir.mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json.dumps(sample_feature_meta),
-            encoding="utf-8"
-        )
+        auth_dir.mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
 
         repo = FeatureRepository(features_root=str(temp_features_root))
         # KEIN discover_all() → Cache leer
@@ -226,6 +630,67 @@ class TestGetFeatureById:
 
         assert exc_info.value.feature_id == "nonexistent"
 
+    def test_get_by_id_caches_missing_feature(
+        self,
+        temp_features_root: Path,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Fehlendes Feature wird gemerkt; invalidate() hebt das auf."""
+        # Arrange
+        repo = FeatureRepository(features_root=str(temp_features_root))
+        with pytest.raises(FeatureNotFoundException):
+            repo.get_by_id("authenticator")
+
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir()
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
+
+        # Act & Assert: Negativ-Cache greift ohne Dateizugriff
+        with patch.object(repo, "_load_and_validate") as load:
+            with pytest.raises(FeatureNotFoundException):
+                repo.get_by_id("authenticator")
+        load.assert_not_called()
+
+        # Act & Assert: nach invalidate() wird neu gelesen
+        repo.invalidate("authenticator")
+        assert repo.get_by_id("authenticator").id == "authenticator"
+
+    def test_missing_cache_is_bounded(
+        self,
+        temp_features_root: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Negativ-Cache verdrängt die älteste ID, wenn MISSING_CACHE_SIZE erreicht ist."""
+        # Arrange
+        monkeypatch.setattr(FeatureRepository, "MISSING_CACHE_SIZE", 2)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        for feature_id in ("a", "b", "c"):
+            with pytest.raises(FeatureNotFoundException):
+                repo.get_by_id(feature_id)
+
+        # Assert
+        assert list(repo._missing) == ["b", "c"]
+
+    def test_missing_cache_evicts_least_recently_requested(
+        self,
+        temp_features_root: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Erneut erfragte Fehl-ID bleibt im Negativ-Cache, verdrängt wird die älteste."""
+        # Arrange
+        monkeypatch.setattr(FeatureRepository, "MISSING_CACHE_SIZE", 2)
+        repo = FeatureRepository(features_root=str(temp_features_root))
+
+        # Act
+        for feature_id in ("a", "b", "a", "c"):
+            with pytest.raises(FeatureNotFoundException):
+                repo.get_by_id(feature_id)
+
+        # Assert
+        assert list(repo._missing) == ["a", "c"]
+
 
 class TestIdConvention:
     """Tests für id == Ordnername-Konvention."""
@@ -241,11 +706,8 @@ class TestIdConvention:
         meta["id"] = "wrong_id"  # Ordner heißt "user_management"
 
         feature_dir = temp_features_root / "user_management"
-        feature_dir.mkdir(parents=True, exist_ok=True)
-        (feature_dir / "meta.json").write_text(
-            json.dumps(meta),
-            encoding="utf-8"
-        )
+        feature_dir.mkdir(exist_ok=True)
+        (feature_dir / "meta.json").write_bytes(json.dumps(meta).encode())
 
         # Act & Assert
         repo = FeatureRepository(features_root=str(temp_features_root))
@@ -266,11 +728,8 @@ class TestIdConvention:
         meta["id"] = "Authenticator"  # Ordner heißt "authenticator"
 
         feature_dir = temp_features_root / "authenticator"
-        feature_dir.mkdir(parents=True, exist_ok=True)
-        (feature_dir / "meta.json").write_text(
-            json.dumps(meta),
-            encoding="utf-8"
-        )
+        feature_dir.mkdir(exist_ok=True)
+        (feature_dir / "meta.json").write_bytes(json.dumps(meta).encode())
 
         # Act & Assert
         repo = FeatureRepository(features_root=str(temp_features_root))
@@ -5,6 +5,7 @@ Diese Tests stellen sicher, dass audit-Konfiguration in meta.json
 korrekt validiert wird und typische Fehler sauber als InvalidMetaException
 reportet werden.
 """
+import sys
 from pathlib import Path
 from typing import Dict, Any
 import pytest
@@ -89,6 +90,20 @@ def test_audit_min_log_level_must_be_valid(tmp_path: Path) -> None:
     assert "min_log_level" in str(exc_info.value.reason)
 
 
+def test_audit_min_log_level_must_be_string(tmp_path: Path) -> None:
+    """Test: Nicht-String min_log_level (unhashbar) → InvalidMetaException statt TypeError."""
+    feature_id = "list_log_level"
+    meta = _base_meta(feature_id)
+    meta["audit"] = {"must_audit": True, "min_log_level": ["INFO"]}
+
+    create_meta_json(tmp_path / feature_id, meta)
+    repo = FeatureRepository(features_root=str(tmp_path), strict_mode=True)
+
+    with pytest.raises(InvalidMetaException) as exc_info:
+        repo.discover_all()
+    assert "['CRITICAL', 'DEBUG', 'ERROR', 'INFO', 'WARNING']" in str(exc_info.value.reason)
+
+
 def test_audit_must_be_dict(tmp_path: Path) -> None:
     """Test: audit muss ein Objekt/Dict sein."""
     feature_id = "audit_not_dict"
@@ -138,7 +153,7 @@ def test_audit_valid_configuration(tmp_path: Path) -> None:
     assert descriptors[0].audit is not None
     assert descriptors[0].audit.must_audit is True
     assert descriptors[0].audit.min_log_level == "WARNING"
-    assert descriptors[0].audit.critical_actions == ["DELETE", "UPDATE"]
+    assert descriptors[0].audit.critical_actions == ("DELETE", "UPDATE")
     assert descriptors[0]. audit.retention_days == 730
 
 
@@ -173,6 +188,25 @@ def test_version_must_follow_semantic_versioning(tmp_path: Path) -> None:
     assert "semantic versioning" in str(exc_info.value.reason)
 
 
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        ("1.0.0", True),
+        ("10.20.300", True),
+        ("1.0", False),
+        ("1.0.0.0", False),
+        ("1..0", False),
+        ("1.0.0\n", False),
+        ("1.0.x", False),
+        ("v1.0.0", False),
+        (100, False),
+    ],
+)
+def test_is_semver(version: Any, expected: bool) -> None:
+    """Test: Versionsprüfung X.Y.Z ohne Regex."""
+    assert FeatureRepository._is_semver(version) is expected
+
+
 def test_visible_for_must_be_list(tmp_path: Path) -> None:
     """Test: visible_for muss eine Liste sein."""
     feature_id = "invalid_visible_for"
@@ -203,6 +237,48 @@ def test_dependencies_must_be_list(tmp_path: Path) -> None:
     assert "list" in str(exc_info.value.reason)
 
 
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("visible_for", [1]),
+        ("dependencies", [["authenticator"]]),
+    ],
+)
+def test_list_entries_must_be_strings(tmp_path: Path, field: str, value: list) -> None:
+    """Test: Einträge in visible_for/dependencies müssen Strings sein."""
+    feature_id = "invalid_entries"
+    meta = _base_meta(feature_id)
+    meta[field] = value
+
+    create_meta_json(tmp_path / feature_id, meta)
+    repo = FeatureRepository(features_root=str(tmp_path), strict_mode=True)
+
+    with pytest.raises(InvalidMetaException) as exc_info:
+        repo.discover_all()
+    assert f"{field} entries must be strings" in str(exc_info.value.reason)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("visible_for", [1]),
+        ("dependencies", [["authenticator"]]),
+    ],
+)
+def test_invalid_list_entries_skipped_in_non_strict_mode(
+    tmp_path: Path, field: str, value: list
+) -> None:
+    """Test: Ohne strict_mode wird nur das fehlerhafte Feature übersprungen."""
+    create_meta_json(tmp_path / "good_feature", _base_meta("good_feature"))
+    bad_meta = _base_meta("bad_feature")
+    bad_meta[field] = value
+    create_meta_json(tmp_path / "bad_feature", bad_meta)
+    repo = FeatureRepository(features_root=str(tmp_path), strict_mode=False)
+
+    features = repo.discover_all()
+    assert [f.id for f in features] == ["good_feature"]
+
+
 def test_is_core_must_be_boolean(tmp_path: Path) -> None:
     """Test: is_core muss ein Boolean sein."""
     feature_id = "invalid_is_core"
@@ -259,4 +335,32 @@ def test_sort_order_must_be_integer_not_string(tmp_path: Path) -> None:
 
     with pytest.raises(InvalidMetaException) as exc_info:
         repo.discover_all()
-    assert "sort_order" in str(exc_info.value.reason)
\ No newline at end of file
+    assert "sort_order" in str(exc_info.value.reason)
+
+
+def test_list_fields_are_stored_as_tuples(tmp_path: Path) -> None:
+    """Test: visible_for/dependencies landen als Tuple im Descriptor."""
+    feature_id = "tuple_fields"
+    meta = _base_meta(feature_id)
+    meta["dependencies"] = ["authenticator"]
+
+    create_meta_json(tmp_path / feature_id, meta)
+    repo = FeatureRepository(features_root=str(tmp_path), strict_mode=True)
+
+    descriptor = repo.discover_all()[0]
+    assert descriptor.visible_for == ("ADMIN",)
+    assert descriptor.dependencies == ("authenticator",)
+
+
+def test_ids_and_roles_are_interned(tmp_path: Path) -> None:
+    """Test: id, Rollen und Abhängigkeiten sind internierte Strings."""
+    for feature_id in ("feature_a", "feature_b"):
+        meta = _base_meta(feature_id)
+        meta["dependencies"] = ["authenticator"]
+        create_meta_json(tmp_path / feature_id, meta)
+    repo = FeatureRepository(features_root=str(tmp_path), strict_mode=True)
+
+    first, second = repo.discover_all()
+    assert first.id is sys.intern("feature_a")
+    assert first.visible_for[0] is second.visible_for[0]
+    assert first.dependencies[0] is second.dependencies[0]
@@ -0,0 +1,25 @@
+"""
+Tests für json_loader (orjson mit stdlib-Fallback).
+"""
+from pathlib import Path
+
+import pytest
+
+from configurator.repository.json_loader import JSONDecodeError, load_json_file
+
+
+def test_load_json_file_parses_utf8(tmp_path: Path) -> None:
+    """UTF-8-Inhalt wird direkt aus bytes geparst."""
+    path = tmp_path / "meta.json"
+    path.write_bytes('{"label": "Prüfung", "n": 1}'.encode("utf-8"))
+
+    assert load_json_file(path) == {"label": "Prüfung", "n": 1}
+
+
+def test_load_json_file_raises_json_decode_error(tmp_path: Path) -> None:
+    """Ungültiges JSON → json.JSONDecodeError (auch unter orjson)."""
+    path = tmp_path / "meta.json"
+    path.write_bytes(b"{ invalid")
+
+    with pytest.raises(JSONDecodeError):
+        load_json_file(path)
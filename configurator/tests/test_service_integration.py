@@ -9,14 +9,18 @@ Version: 1.0.0
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from configurator.dto.feature_registry_dto import FeatureRegistryDTO
 from configurator.enum.feature_status import FeatureStatus
 from configurator.exceptions.feature_not_found_exception import FeatureNotFoundException
+from configurator.repository.feature_repository import FeatureRepository
 from configurator.services.configurator_service import ConfiguratorService
+from configurator.tests.helpers import dump_json_bytes
 
 
 class TestDiscoverFeatures:
@@ -29,18 +33,17 @@ class TestDiscoverFeatures:
         sample_feature_meta:  dict
     ) -> None:
         """Discovery gibt alle gültigen Features zurück."""
-        # Arrange:   3 Features erstellen
-        for feature_id in ["auth", "users", "audit"]:
-            meta = sample_feature_meta.copy()
-            meta["id"] = feature_id
-            meta["label"] = feature_id.title()
-
-            feature_dir = temp_features_root / feature_id
-            feature_dir.mkdir(parents=True, exist_ok=True)
-            (feature_dir / "meta.json").write_text(
-                json.dumps(meta),
-                encoding="utf-8"
+        # Arrange:   3 Features erstellen (meta.json vorab serialisiert)
+        blobs = {
+            feature_id: dump_json_bytes(
+                {**sample_feature_meta, "id": feature_id, "label": feature_id.title()}
             )
+            for feature_id in ("auth", "users", "audit")
+        }
+        for feature_id, blob in blobs.items():
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir()
+            (feature_dir / "meta.json").write_bytes(blob)
 
         # Act
         features = configurator_service.discover_features()
@@ -63,11 +66,8 @@ class TestGetFeatureMeta:
         """get_feature_meta gibt vollständigen Descriptor zurück."""
         # Arrange
         auth_dir = temp_features_root / "authenticator"
-        auth_dir. mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json. dumps(sample_feature_meta),
-            encoding="utf-8"
-        )
+        auth_dir. mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(json.dumps(sample_feature_meta).encode())
 
         # Act
         meta = configurator_service. get_feature_meta("authenticator")
@@ -106,11 +106,8 @@ class TestGetAllFeatures:
         meta1["visible_for"] = []
 
         public_dir = temp_features_root / "public"
-        public_dir.mkdir(parents=True, exist_ok=True)
-        (public_dir / "meta.json").write_text(
-            json.dumps(meta1),
-            encoding="utf-8"
-        )
+        public_dir.mkdir(exist_ok=True)
+        (public_dir / "meta.json").write_bytes(json.dumps(meta1).encode())
 
         # Feature 2: Nur für ADMIN
         meta2 = sample_feature_meta.copy()
@@ -118,11 +115,8 @@ class TestGetAllFeatures:
         meta2["visible_for"] = ["ADMIN"]
 
         admin_dir = temp_features_root / "admin_only"
-        admin_dir.mkdir(parents=True, exist_ok=True)
-        (admin_dir / "meta.json").write_text(
-            json.dumps(meta2),
-            encoding="utf-8"
-        )
+        admin_dir.mkdir(exist_ok=True)
+        (admin_dir / "meta.json").write_bytes(json.dumps(meta2).encode())
 
         # Act
         registry = configurator_service.get_all_features()
@@ -145,24 +139,24 @@ class TestGetAllFeatures:
         meta1["id"] = "public"
         meta1["visible_for"] = []
         public_dir = temp_features_root / "public"
-        public_dir.mkdir(parents=True, exist_ok=True)
-        (public_dir / "meta.json").write_text(json.dumps(meta1), encoding="utf-8")
+        public_dir.mkdir(exist_ok=True)
+        (public_dir / "meta.json").write_bytes(json.dumps(meta1).encode())
 
         # 2. Nur ADMIN
         meta2 = sample_feature_meta.copy()
         meta2["id"] = "admin_only"
         meta2["visible_for"] = ["ADMIN"]
         admin_dir = temp_features_root / "admin_only"
-        admin_dir.mkdir(parents=True, exist_ok=True)
-        (admin_dir / "meta.json").write_text(json.dumps(meta2), encoding="utf-8")
+        admin_dir.mkdir(exist_ok=True)
+        (admin_dir / "meta.json").write_bytes(json.dumps(meta2).encode())
 
         # 3. USER + QMB
         meta3 = sample_feature_meta.copy()
         meta3["id"] = "user_qmb"
         meta3["visible_for"] = ["USER", "QMB"]
         user_dir = temp_features_root / "user_qmb"
-        user_dir.mkdir(parents=True, exist_ok=True)
-        (user_dir / "meta.json").write_text(json.dumps(meta3), encoding="utf-8")
+        user_dir.mkdir(exist_ok=True)
+        (user_dir / "meta.json").write_bytes(json.dumps(meta3).encode())
 
         # Act:   Als USER
         user_registry = configurator_service.get_all_features(role="USER")
@@ -178,6 +172,80 @@ class TestGetAllFeatures:
         admin_ids = {r.descriptor.id for r in admin_registry}
         assert admin_ids == {"public", "admin_only"}
 
+    def test_get_all_features_reuses_discovery_across_roles(
+        self,
+        temp_features_root: Path,
+        feature_repository: FeatureRepository,
+        configurator_service: ConfiguratorService,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Mehrere Rollen-Abfragen nach einem gemerkten Scan lesen/parsen keine meta.json erneut."""
+        # Arrange: meta.json außerhalb des "racy"-Fensters, damit der Scan gemerkt wird
+        auth_dir = temp_features_root / "authenticator"
+        auth_dir.mkdir(exist_ok=True)
+        meta_path = auth_dir / "meta.json"
+        meta_path.write_bytes(sample_feature_meta_bytes)
+        os.utime(meta_path, ns=(1_000_000_000, 1_000_000_000))
+        configurator_service.discover_features()
+
+        # Act
+        with patch.object(feature_repository, "_load_candidates") as load:
+            admin_registry = configurator_service.get_all_features(role="ADMIN")
+            user_registry = configurator_service.get_all_features(role="USER")
+
+        # Assert
+        load.assert_not_called()
+        assert [r.descriptor.id for r in admin_registry] == ["authenticator"]
+        assert [r.descriptor.id for r in user_registry] == ["authenticator"]
+
+    def test_get_all_features_sees_feature_added_after_first_call(
+        self,
+        temp_features_root: Path,
+        configurator_service: ConfiguratorService,
+        sample_feature_meta: dict
+    ) -> None:
+        """Ein nach dem ersten Aufruf hinzugefügtes Feature erscheint beim nächsten."""
+        # Arrange: Erstes Feature außerhalb des "racy"-Fensters (Scan wird gemerkt)
+        first_path = temp_features_root / "first" / "meta.json"
+        first_path.parent.mkdir()
+        first_path.write_bytes(dump_json_bytes({**sample_feature_meta, "id": "first"}))
+        os.utime(first_path, ns=(1_000_000_000, 1_000_000_000))
+        assert [r.descriptor.id for r in configurator_service.get_all_features()] == ["first"]
+
+        # Act: Zweites Feature anlegen
+        second_dir = temp_features_root / "second"
+        second_dir.mkdir()
+        (second_dir / "meta.json").write_bytes(
+            dump_json_bytes({**sample_feature_meta, "id": "second"})
+        )
+        registry = configurator_service.get_all_features()
+
+        # Assert
+        assert {r.descriptor.id for r in registry} == {"first", "second"}
+
+    def test_get_all_features_does_not_reparse_unchanged_files(
+        self,
+        temp_features_root: Path,
+        feature_repository: FeatureRepository,
+        configurator_service: ConfiguratorService,
+        sample_feature_meta_bytes: bytes
+    ) -> None:
+        """Unveränderte meta.json werden bei erneuten Abfragen nicht neu gelesen/geparst."""
+        # Arrange: meta.json außerhalb des "racy"-Fensters, damit der Scan gemerkt wird
+        meta_path = temp_features_root / "authenticator" / "meta.json"
+        meta_path.parent.mkdir()
+        meta_path.write_bytes(sample_feature_meta_bytes)
+        os.utime(meta_path, ns=(1_000_000_000, 1_000_000_000))
+        configurator_service.discover_features()
+
+        # Act
+        with patch.object(feature_repository, "_load_candidates") as load:
+            registry = configurator_service.get_all_features()
+
+        # Assert
+        load.assert_not_called()
+        assert [r.descriptor.id for r in registry] == ["authenticator"]
+
     def test_get_all_features_sorts_by_sort_order(
         self,
         temp_features_root: Path,
@@ -186,17 +254,16 @@ class TestGetAllFeatures:
     ) -> None:
         """get_all_features sortiert nach sort_order, dann id."""
         # Arrange: 3 Features mit unterschiedlichen sort_order
-        for feature_id, sort_order in [("z", 10), ("a", 20), ("m", 10)]:
-            meta = sample_feature_meta.copy()
-            meta["id"] = feature_id
-            meta["sort_order"] = sort_order
-
-            feature_dir = temp_features_root / feature_id
-            feature_dir.mkdir(parents=True, exist_ok=True)
-            (feature_dir / "meta.json").write_text(
-                json.dumps(meta),
-                encoding="utf-8"
+        blobs = {
+            feature_id: dump_json_bytes(
+                {**sample_feature_meta, "id": feature_id, "sort_order": sort_order}
             )
+            for feature_id, sort_order in (("z", 10), ("a", 20), ("m", 10))
+        }
+        for feature_id, blob in blobs.items():
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir()
+            (feature_dir / "meta.json").write_bytes(blob)
 
         # Act
         registry = configurator_service. get_all_features()
@@ -207,20 +274,43 @@ class TestGetAllFeatures:
         feature_ids = [r.descriptor. id for r in registry]
         assert feature_ids == ["m", "z", "a"]
 
+    @pytest.mark.parametrize(
+        "limit, expected",
+        [(2, ["m", "z"]), (10, ["m", "z", "a"]), (0, [])],
+    )
+    def test_get_all_features_limit_returns_first_entries(
+        self,
+        temp_features_root: Path,
+        configurator_service: ConfiguratorService,
+        sample_feature_meta: dict,
+        limit: int,
+        expected: list
+    ) -> None:
+        """get_all_features(limit=K) liefert die ersten K Einträge der Sortierung."""
+        # Arrange
+        for feature_id, sort_order in [("z", 10), ("a", 20), ("m", 10)]:
+            meta = {**sample_feature_meta, "id": feature_id, "sort_order": sort_order}
+            feature_dir = temp_features_root / feature_id
+            feature_dir.mkdir(exist_ok=True)
+            (feature_dir / "meta.json").write_bytes(json.dumps(meta).encode())
+
+        # Act
+        registry = configurator_service.get_all_features(limit=limit)
+
+        # Assert
+        assert [r.descriptor.id for r in registry] == expected
+
     def test_get_all_features_returns_registry_dtos(
         self,
         temp_features_root: Path,
         configurator_service: ConfiguratorService,
-        sample_feature_meta: dict
+        sample_feature_meta_bytes: bytes
     ) -> None:
         """get_all_features gibt FeatureRegistryDTO zurück."""
         # Arrange
         auth_dir = temp_features_root / "authenticator"
-        auth_dir.mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json.dumps(sample_feature_meta),
-            encoding="utf-8"
-        )
+        auth_dir.mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
 
         # Act
         registry = configurator_service.get_all_features()
@@ -241,16 +331,13 @@ class TestValidateMeta:
         self,
         temp_features_root: Path,
         configurator_service: ConfiguratorService,
-        sample_feature_meta: dict
+        sample_feature_meta_bytes: bytes
     ) -> None:
         """validate_meta gibt True für gültige meta.json."""
         # Arrange
         auth_dir = temp_features_root / "authenticator"
-        auth_dir.mkdir(parents=True, exist_ok=True)
-        (auth_dir / "meta.json").write_text(
-            json.dumps(sample_feature_meta),
-            encoding="utf-8"
-        )
+        auth_dir.mkdir(exist_ok=True)
+        (auth_dir / "meta.json").write_bytes(sample_feature_meta_bytes)
 
         # Act
         result = configurator_service.validate_meta("authenticator")
@@ -266,16 +353,13 @@ class TestGetAppConfig:
         self,
         temp_features_root: Path,
         configurator_service: ConfiguratorService,
-        sample_app_config: dict
+        sample_app_config_bytes: bytes
     ) -> None:
         """get_app_config gibt AppConfigDTO zurück."""
         # Arrange
         config_dir = temp_features_root / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        (config_dir / "app_config.json").write_text(
-            json.dumps(sample_app_config),
-            encoding="utf-8"
-        )
+        config_dir.mkdir(exist_ok=True)
+        (config_dir / "app_config.json").write_bytes(sample_app_config_bytes)
 
         # Act
         config = configurator_service.get_app_config()
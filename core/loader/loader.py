@@ -104,6 +104,7 @@ class Loader:
         self._container = Container()
         self._env: Optional[AppEnv] = None
         self._boot_log: List[str] = []
+        self._feature_ids: List[str] = []
         self._booted = False
     
     def boot(self) -> List[str]:
@@ -134,6 +135,7 @@ class Loader:
             
             # Step 3: Discover features
             features = self._discover_features()
+            self._feature_ids = list(features)
             
             # Step 4: Build dependency graph and compute boot order
             boot_order = self._compute_boot_order(features)
@@ -382,7 +384,10 @@ class Loader:
             db_path = parse_database_path(self._env.database_url)
             repo = AuditRepository(db_path)
             policy = AuditPolicy()
-            return AuditService(repo, policy, cfg)
+            service = AuditService(repo, policy, cfg)
+            # Load the audit config of every discovered feature once at startup
+            service.preload_feature_audit_configs(self._feature_ids)
+            return service
         
         self._container.add_singleton(KEY_AUDIT_SERVICE, create_audit_service)
         self._container.add_alias(KEY_AUDIT_SINK, KEY_AUDIT_SERVICE)
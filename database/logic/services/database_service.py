@@ -5,7 +5,7 @@ from contextlib import contextmanager
 from typing import Optional
 from pathlib import Path
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, event, Engine
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
 from .database_service_interface import DatabaseServiceInterface, UnitOfWorkInterface
@@ -18,6 +18,28 @@ from ..exceptions.transaction_exception import UnitOfWorkException
 from ...models.base import Base
 
 
+# Applied to every SQLite connection (SQLAlchemy pool and raw legacy connections).
+# WAL lets readers run concurrently with a writer; synchronous=NORMAL is durable
+# in WAL mode and only fsyncs at checkpoints instead of on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection) -> None:
+    """Apply SQLITE_PRAGMAS to a DB-API SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class DatabaseService(DatabaseServiceInterface):
     """
     Database service implementation with SQLite support.
@@ -62,6 +84,9 @@ class DatabaseService(DatabaseServiceInterface):
                 connect_args={"check_same_thread": False} if self._database_url.startswith("sqlite") else {}
             )
             
+            if self._database_url.startswith("sqlite"):
+                event.listen(self._engine, "connect", self._on_sqlite_connect)
+            
             # Create session factory
             self._session_factory = sessionmaker(
                 bind=self._engine,
@@ -82,6 +107,11 @@ class DatabaseService(DatabaseServiceInterface):
                 cause=e
             )
     
+    @staticmethod
+    def _on_sqlite_connect(dbapi_connection, connection_record) -> None:
+        """Engine connect hook: tune every new SQLite connection."""
+        _apply_sqlite_pragmas(dbapi_connection)
+    
     def get_session(self) -> Session:
         """
         Get thread-local SQLAlchemy session.
@@ -133,6 +163,7 @@ class DatabaseService(DatabaseServiceInterface):
                 db_path,
                 check_same_thread=False
             )
+            _apply_sqlite_pragmas(self._local.connection)
             
             return self._local.connection
             
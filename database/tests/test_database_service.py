@@ -144,3 +144,22 @@ class TestDatabaseService:
         new_service = DatabaseService("sqlite:///:memory:")
         assert new_service is not None
         new_service.close()
+
+    def test_sqlite_pragmas_applied(self, tmp_path):
+        """Test that file-based SQLite connections use WAL and tuned pragmas."""
+        # Arrange
+        service = DatabaseService(f"sqlite:///{tmp_path / 'pragma.db'}")
+        
+        try:
+            # Act
+            with service.get_engine().connect() as conn:
+                journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+                synchronous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+            raw_journal_mode = service.get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+            
+            # Assert
+            assert journal_mode == "wal"
+            assert synchronous == 1  # NORMAL
+            assert raw_journal_mode == "wal"
+        finally:
+            service.close()
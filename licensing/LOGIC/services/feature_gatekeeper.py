@@ -44,7 +44,7 @@ class FeatureGatekeeper(FeatureGatekeeperInterface):
         """
         # 1. Check if feature is core (always allowed)
         if meta.get("is_core", False):
-            logger.debug(f"Feature {meta.get('id')} is core, allowing registration")
+            logger.debug("Feature %s is core, allowing registration", meta.get("id"))
             return GateDecisionDTO(
                 allowed=True,
                 feature_code=meta.get("id", "unknown"),
@@ -58,7 +58,7 @@ class FeatureGatekeeper(FeatureGatekeeperInterface):
         
         if not requires_license:
             # Feature doesn't require license, allow
-            logger.debug(f"Feature {meta.get('id')} doesn't require license")
+            logger.debug("Feature %s doesn't require license", meta.get("id"))
             return GateDecisionDTO(
                 allowed=True,
                 feature_code=meta.get("id", "unknown"),
@@ -69,7 +69,7 @@ class FeatureGatekeeper(FeatureGatekeeperInterface):
         # 3. Validate feature_code
         feature_code = licensing_config.get("feature_code", "")
         if not feature_code:
-            logger.error(f"Feature {meta.get('id')} requires license but has no feature_code")
+            logger.error("Feature %s requires license but has no feature_code", meta.get("id"))
             return GateDecisionDTO(
                 allowed=False,
                 feature_code=meta.get("id", "unknown"),
@@ -78,7 +78,7 @@ class FeatureGatekeeper(FeatureGatekeeperInterface):
             )
         
         if not self.FEATURE_CODE_PATTERN.match(feature_code):
-            logger.error(f"Invalid feature_code format: {feature_code}")
+            logger.error("Invalid feature_code format: %s", feature_code)
             return GateDecisionDTO(
                 allowed=False,
                 feature_code=feature_code,
@@ -88,7 +88,7 @@ class FeatureGatekeeper(FeatureGatekeeperInterface):
         
         # 4. Check entitlement
         if entitlements.is_entitled(feature_code):
-            logger.info(f"Feature {feature_code} is entitled, allowing registration")
+            logger.info("Feature %s is entitled, allowing registration", feature_code)
             return GateDecisionDTO(
                 allowed=True,
                 feature_code=feature_code,
@@ -96,7 +96,7 @@ class FeatureGatekeeper(FeatureGatekeeperInterface):
                 error_code=None
             )
         else:
-            logger.warning(f"Feature {feature_code} is not entitled, blocking registration")
+            logger.warning("Feature %s is not entitled, blocking registration", feature_code)
             return GateDecisionDTO(
                 allowed=False,
                 feature_code=feature_code,
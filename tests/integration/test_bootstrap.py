@@ -134,6 +134,22 @@ class TestBootstrap:
         for key in core_services:
             assert container.is_registered(key), f"Service {key} not registered"
     
+    def test_audit_configs_preloaded_on_boot(self, project_root):
+        """Verify the audit service preloads the discovered features' audit configs."""
+        loader = Loader(
+            config_path=str(project_root / "config.ini"),
+            project_root=project_root
+        )
+        
+        loader.boot()
+        audit = loader.get_container().resolve("audit.IAuditService")
+        
+        assert "audittrail" in audit._feature_audit_configs
+        with patch.object(audit, "_parse_audit_config") as parse:
+            config = audit.get_feature_audit_config("audittrail")
+        parse.assert_not_called()
+        assert config["min_log_level"] == "WARNING"
+    
     def test_env_loaded_from_config(self, project_root):
         """Test environment is loaded from config.ini."""
         loader = Loader(
@@ -24,6 +24,17 @@ class UserEntity:
         self.created_at = datetime.now()
         self.last_login_at: Optional[datetime] = None
 
+    @property
+    def password_hash(self) -> str:
+        """Gespeicherter Passwort-Hash."""
+        return self._password_hash
+
+    @password_hash.setter
+    def password_hash(self, value: str) -> None:
+        # Bytes-Form einmalig mitführen (bcrypt.checkpw erwartet bytes)
+        self._password_hash = value
+        self.password_hash_bytes = value.encode('utf-8')
+
 
 class UserRepository:
     """
@@ -33,6 +33,16 @@ class TestUserRepository:
         assert isinstance(user.created_at, datetime)
         assert user.last_login_at is None
 
+    def test_password_hash_bytes_follow_hash(self, repository):
+        """Test: Bytes-Form des Hashes wird bei Änderung mitgeführt."""
+        user = repository.create("testuser", "hash123", SystemRole.USER)
+
+        assert user.password_hash_bytes == b"hash123"
+
+        user.password_hash = "hash456"
+
+        assert user.password_hash_bytes == b"hash456"
+
     def test_create_user_without_email(self, repository):
         """Test: User ohne Email wird erstellt."""
         user = repository.create("nomail", "hash456", SystemRole.ADMIN)